@@ -1,150 +1,584 @@
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 import heapq
-from maze import maze 
-
-def a_star(start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
-    def heuristic(a: Tuple[int, int], b: Tuple[int, int]) -> int:
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-    def get_neighbors(pos: Tuple[int, int]) -> List[Tuple[int, int]]:
-        x, y = pos
-        neighbors = [(x+1, y), (x-1, y), (x, y+1), (x, y-1)]
-        return [(nx, ny) for nx, ny in neighbors if 0 <= nx < len(maze[0]) and 0 <= ny < len(maze) and maze[ny][nx] != 1]
-
-    start_node = Node(start)
-    start_node.h = heuristic(start, goal)
-    open_list = [start_node]
+import weakref
+from array import array
+from grid import Grid, DIRECTIONS
+
+class SearchStats:
+    """Счетчики одного поиска: раскрытые узлы, добавления в очередь, пик размера фронта
+    и число клеток в служебных словарях поиска (g, родители) - оценка памяти"""
+    def __init__(self):
+        self.expanded = 0
+        self.pushed = 0
+        self.peak_frontier = 0
+        self.stored = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {'expanded': self.expanded, 'pushed': self.pushed, 'peak_frontier': self.peak_frontier,
+                'stored': self.stored}
+
+def a_star(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int],
+           stats: Optional[SearchStats] = None) -> List[Tuple[int, int]]:
+    goal_x, goal_y = goal
+    h = abs(start[0] - goal_x) + abs(start[1] - goal_y)
+    # Записи кучи - простые кортежи (f, h, позиция): при равном f сначала раскрываем
+    # узел ближе к цели, а дальше порядок задают координаты, поэтому результат детерминирован
+    open_heap = [(h, h, start)]
+    g_score: Dict[Tuple[int, int], int] = {start: 0}
+    came_from: Dict[Tuple[int, int], Tuple[int, int]] = {}
     closed_set = set()
-    came_from: Dict[Tuple[int, int], Node] = {}
+    expanded = pushed = peak_frontier = 0
 
-    while open_list:
-        current = heapq.heappop(open_list)
+    while open_heap:
+        if len(open_heap) > peak_frontier:
+            peak_frontier = len(open_heap)
+        _, _, current = heapq.heappop(open_heap)
+
+        # Ленивое удаление: устаревшие записи с худшим g просто пропускаем
+        if current in closed_set:
+            continue
 
-        if current.position == goal:
+        if current == goal:
             path = []
-            while current.position != start:
-                path.append(current.position)
-                current = came_from[current.position]
+            while current != start:
+                path.append(current)
+                current = came_from[current]
             path.reverse()
-            return path
-
-        closed_set.add(current.position)
-
-        for neighbor_pos in get_neighbors(current.position):
-            if neighbor_pos in closed_set:
-                continue
+            break
 
-            neighbor = Node(neighbor_pos, current.g + 1)
-            neighbor.h = heuristic(neighbor_pos, goal)
-
-            if neighbor not in open_list:
-                came_from[neighbor_pos] = current
-                heapq.heappush(open_list, neighbor)
-            elif neighbor.g < current.g:
-                came_from[neighbor_pos] = current
-                open_list.remove(neighbor)
-                heapq.heappush(open_list, neighbor)
-
-    return []
-
-def greedy_best_first_search(start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
-    def heuristic(a: Tuple[int, int], b: Tuple[int, int]) -> int:
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])  # Манхэттенское расстояние
-
-    def get_neighbors(pos: Tuple[int, int]) -> List[Tuple[int, int]]:
-        x, y = pos
-        neighbors = [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]
-        return [(nx, ny) for nx, ny in neighbors if 0 <= nx < len(maze[0]) and 0 <= ny < len(maze) and maze[ny][nx] != 1]
-
-    open_list = []
-    closed_set = set()
-    came_from: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        closed_set.add(current)
+        expanded += 1
 
-    heapq.heappush(open_list, (heuristic(start, goal), start))
+        g = g_score[current] + 1
+        for neighbor in grid.get_neighbors(current):
+            if g < g_score.get(neighbor, g + 1):
+                g_score[neighbor] = g
+                came_from[neighbor] = current
+                h = abs(neighbor[0] - goal_x) + abs(neighbor[1] - goal_y)
+                heapq.heappush(open_heap, (g + h, h, neighbor))
+                pushed += 1
+    else:
+        path = []
+
+    if stats is not None:
+        stats.expanded = expanded
+        stats.pushed = pushed
+        stats.peak_frontier = peak_frontier
+        stats.stored = len(g_score)
+    return path
+
+def greedy_best_first_search(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int],
+                             stats: Optional[SearchStats] = None) -> List[Tuple[int, int]]:
+    goal_x, goal_y = goal
+    # Клетка попадает в came_from, когда впервые кладется в очередь, поэтому
+    # came_from - это сразу и открытое, и закрытое множество: проверка за O(1)
+    open_list = [(abs(start[0] - goal_x) + abs(start[1] - goal_y), start)]
+    came_from: Dict[Tuple[int, int], Tuple[int, int]] = {start: None}
+    expanded = pushed = peak_frontier = 0
+    path = []
 
     while open_list:
+        if len(open_list) > peak_frontier:
+            peak_frontier = len(open_list)
         _, current = heapq.heappop(open_list)
 
         if current == goal:
-            path = []
             while current != start:
                 path.append(current)
                 current = came_from[current]
             path.reverse()
-            return path
-
-        closed_set.add(current)
-
-        for neighbor in get_neighbors(current):
-            if neighbor in closed_set:
-                continue
+            break
 
-            if neighbor not in [item[1] for item in open_list]:
+        expanded += 1
+        for neighbor in grid.get_neighbors(current):
+            if neighbor not in came_from:
                 came_from[neighbor] = current
-                heapq.heappush(open_list, (heuristic(neighbor, goal), neighbor))
-
-    return []
-
-def bfs(start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
+                heapq.heappush(open_list, (abs(neighbor[0] - goal_x) + abs(neighbor[1] - goal_y), neighbor))
+                pushed += 1
+
+    if stats is not None:
+        stats.expanded = expanded
+        stats.pushed = pushed
+        stats.peak_frontier = peak_frontier
+        stats.stored = len(came_from)
+    return path
+
+def bfs(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int],
+        stats: Optional[SearchStats] = None) -> List[Tuple[int, int]]:
     from collections import deque
 
-    def get_neighbors(pos: Tuple[int, int]) -> List[Tuple[int, int]]:
-        x, y = pos
-        neighbors = [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]
-        return [(nx, ny) for nx, ny in neighbors if 0 <= nx < len(maze[0]) and 0 <= ny < len(maze) and maze[ny][nx] != 1]
-
     queue = deque([start])
     came_from: Dict[Tuple[int, int], Tuple[int, int]] = {start: None}
+    expanded = peak_frontier = 0
+    path = []
 
     while queue:
+        if len(queue) > peak_frontier:
+            peak_frontier = len(queue)
         current = queue.popleft()
 
         if current == goal:
-            path = []
             while current != start:
                 path.append(current)
                 current = came_from[current]
             path.reverse()
-            return path
+            break
 
-        for neighbor in get_neighbors(current):
+        expanded += 1
+        for neighbor in grid.get_neighbors(current):
             if neighbor not in came_from:  # Изменено на проверку только в came_from
                 queue.append(neighbor)
                 came_from[neighbor] = current
 
-    return []
-
-def dfs(start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
-    def get_neighbors(pos: Tuple[int, int]) -> List[Tuple[int, int]]:
-        x, y = pos
-        neighbors = [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]
-        return [(nx, ny) for nx, ny in neighbors if 0 <= nx < len(maze[0]) and 0 <= ny < len(maze) and maze[ny][nx] != 1]
-
-    stack = [(start, [start])]
-    visited = set()
+    if stats is not None:
+        stats.expanded = expanded
+        stats.pushed = len(came_from) - 1
+        stats.peak_frontier = peak_frontier
+        stats.stored = len(came_from)
+    return path
+
+def dfs(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int],
+        stats: Optional[SearchStats] = None) -> List[Tuple[int, int]]:
+    """Путь в глубину (не кратчайший); как и у остальных поисков, без стартовой клетки"""
+    # В стеке лежат пары (клетка, откуда пришли) вместо копий всего пути; путь
+    # восстанавливается по родителям, которые фиксируются при раскрытии клетки
+    stack = [(start, None)]
+    parent: Dict[Tuple[int, int], Tuple[int, int]] = {}
+    expanded = pushed = peak_frontier = 0
+    result = []
 
     while stack:
-        current, path = stack.pop()
+        if len(stack) > peak_frontier:
+            peak_frontier = len(stack)
+        current, came_from = stack.pop()
 
         if current == goal:
-            return path
+            if came_from is not None:
+                result.append(current)
+                while came_from != start:
+                    result.append(came_from)
+                    came_from = parent[came_from]
+                result.reverse()
+            break
+
+        if current not in parent:
+            parent[current] = came_from
+            expanded += 1
+
+            for neighbor in grid.get_neighbors(current):
+                if neighbor not in parent:
+                    stack.append((neighbor, current))
+                    pushed += 1
+
+    if stats is not None:
+        stats.expanded = expanded
+        stats.pushed = pushed
+        stats.peak_frontier = peak_frontier
+        stats.stored = len(parent)
+    return result
+
+def expand_reverse_tree(grid: Grid, next_step: Dict[Tuple[int, int], Tuple[int, int]], queue,
+                        remaining=None) -> Tuple[int, int]:
+    """Продолжает обратный BFS: next_step - клетка -> следующий шаг к корню, queue - его фронт.
+
+    Без remaining раскрывает все достижимое, иначе останавливается, как только все клетки
+    из remaining (множество, изменяется) попали в дерево. Возвращает (раскрыто, пик фронта).
+    """
+    expanded = peak_frontier = 0
+    get_neighbors = grid.get_neighbors
+    while queue and (remaining is None or remaining):
+        if len(queue) > peak_frontier:
+            peak_frontier = len(queue)
+        current = queue.popleft()
+        expanded += 1
+        for neighbor in get_neighbors(current):
+            if neighbor not in next_step:
+                next_step[neighbor] = current
+                queue.append(neighbor)
+                if remaining is not None:
+                    remaining.discard(neighbor)
+    return expanded, peak_frontier
+
+def reverse_bfs(grid: Grid, goal: Tuple[int, int], starts=None,
+                stats: Optional[SearchStats] = None) -> Dict[Tuple[int, int], Tuple[int, int]]:
+    """BFS от цели: для каждой достигнутой клетки возвращает следующий шаг к цели.
+
+    Если переданы starts, поиск останавливается, как только достигнуты все они.
+    """
+    from collections import deque
 
-        if current not in visited:
-            visited.add(current)
+    next_step: Dict[Tuple[int, int], Tuple[int, int]] = {goal: None}
+    remaining = set(starts) - {goal} if starts is not None else None
+    expanded, peak_frontier = expand_reverse_tree(grid, next_step, deque([goal]), remaining)
+
+    if stats is not None:
+        stats.expanded = expanded
+        stats.pushed = len(next_step)
+        stats.peak_frontier = peak_frontier
+        stats.stored = len(next_step)
+    return next_step
+
+def follow_next_steps(next_step: Dict[Tuple[int, int], Tuple[int, int]], start: Tuple[int, int]) -> List[Tuple[int, int]]:
+    """Разворачивает путь от start по карте следующих шагов (без стартовой клетки)"""
+    if start not in next_step:
+        return []
+    path = []
+    current = next_step[start]
+    while current is not None:
+        path.append(current)
+        current = next_step[current]
+    return path
+
+def batch_paths(grid: Grid, starts, goal: Tuple[int, int],
+                stats: Optional[SearchStats] = None) -> Dict[Tuple[int, int], List[Tuple[int, int]]]:
+    """Пути к общей цели сразу для всех стартов за один обратный поиск"""
+    next_step = reverse_bfs(grid, goal, starts, stats)
+    return {start: follow_next_steps(next_step, start) for start in starts}
+
+class JumpTable:
+    """Заранее посчитанные остановки прыжков JPS для одной ревизии Grid.
+
+    Для каждой клетки и направления хранится координата первой клетки, где прыжок
+    из соседней клетки остановится, не считая цели: стена, клетка с вынужденным
+    соседом, а при движении по вертикали еще и клетка, из которой есть прыжок вбок.
+    Цель добавляется при запросе: она в той же строке или столбце до остановки, либо
+    в строке, которую вертикальный прыжок пересекает, и между ними нет стены (номера
+    отрезков строк). Поэтому прыжок стоит O(1), а не проход по клеткам.
+    """
+
+    def __init__(self, grid: Grid):
+        self.revision = grid.revision
+        width, height = grid.width, grid.height
+        self.width, self.height = width, height
+        size = width * height
+        is_open = bytearray(size)
+        for x, y in grid.neighbors:
+            is_open[y * width + x] = 1
+        self.is_open = is_open
+
+        def passable(x, y):
+            return 0 <= x < width and 0 <= y < height and is_open[y * width + x]
+
+        # Горизонталь: right/left - x остановки при движении вправо/влево, начиная с клетки
+        right = array('i', bytes(4 * size))
+        left = array('i', bytes(4 * size))
+        row_ids = array('i', [-1]) * size
+        segment = 0
+        for y in range(height):
+            row = y * width
+            stop = width
+            for x in range(width - 1, -1, -1):
+                if not is_open[row + x] or (passable(x, y - 1) and not passable(x - 1, y - 1)) or \
+                        (passable(x, y + 1) and not passable(x - 1, y + 1)):
+                    stop = x
+                right[row + x] = stop
+            stop = -1
+            previous = False
+            for x in range(width):
+                if not is_open[row + x]:
+                    left[row + x] = stop = x
+                    previous = False
+                    continue
+                if (passable(x, y - 1) and not passable(x + 1, y - 1)) or \
+                        (passable(x, y + 1) and not passable(x + 1, y + 1)):
+                    stop = x
+                left[row + x] = stop
+                if not previous:
+                    segment += 1
+                    previous = True
+                row_ids[row + x] = segment
+
+        # Из клетки есть прыжок вбок, если в ее строке до стены есть вынужденный сосед
+        side = bytearray(size)
+        for y in range(height):
+            row = y * width
+            for x in range(width):
+                if is_open[row + x]:
+                    stop_right = right[row + x + 1] if x + 1 < width else width
+                    stop_left = left[row + x - 1] if x else -1
+                    if (stop_right < width and is_open[row + stop_right]) or \
+                            (stop_left >= 0 and is_open[row + stop_left]):
+                        side[row + x] = 1
+
+        # Вертикаль: down/up - y остановки при движении вниз/вверх, начиная с клетки
+        down = array('i', bytes(4 * size))
+        up = array('i', bytes(4 * size))
+        for x in range(width):
+            stop = height
+            for y in range(height - 1, -1, -1):
+                i = y * width + x
+                if not is_open[i] or side[i] or (passable(x - 1, y) and not passable(x - 1, y - 1)) or \
+                        (passable(x + 1, y) and not passable(x + 1, y - 1)):
+                    stop = y
+                down[i] = stop
+            stop = -1
+            for y in range(height):
+                i = y * width + x
+                if not is_open[i] or side[i] or (passable(x - 1, y) and not passable(x - 1, y + 1)) or \
+                        (passable(x + 1, y) and not passable(x + 1, y + 1)):
+                    stop = y
+                up[i] = stop
+
+        self.right, self.left, self.down, self.up = right, left, down, up
+        self.row_ids = row_ids
+
+    def jump(self, x: int, y: int, dx: int, dy: int, goal: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """Точка прыжка из (x, y) в направлении (dx, dy): цель, остановка или None у стены"""
+        width = self.width
+        goal_x, goal_y = goal
+        if dx:
+            x += dx
+            if not 0 <= x < width:
+                return None
+            stop = (self.right if dx > 0 else self.left)[y * width + x]
+            if goal_y == y and (x <= goal_x <= stop if dx > 0 else stop <= goal_x <= x):
+                return goal
+            if 0 <= stop < width and self.is_open[y * width + stop]:
+                return stop, y
+            return None
+
+        y += dy
+        if not 0 <= y < self.height:
+            return None
+        stop = (self.down if dy > 0 else self.up)[y * width + x]
+        if y <= goal_y <= stop if dy > 0 else stop <= goal_y <= y:
+            if goal_x == x:
+                return goal
+            row_ids = self.row_ids
+            if goal_y != stop and row_ids[goal_y * width + x] == row_ids[goal_y * width + goal_x]:
+                return x, goal_y  # Отсюда прыжок вбок приходит в цель
+        if 0 <= stop < self.height and self.is_open[stop * width + x]:
+            return x, stop
+        return None
+
+# Таблицы прыжков по Grid; сама таблица не ссылается на Grid, поэтому запись удаляется вместе с ним
+_jump_tables = weakref.WeakKeyDictionary()
+
+def jump_table(grid: Grid) -> JumpTable:
+    """Таблица прыжков для текущей ревизии Grid (перестраивается после изменения стен)"""
+    table = _jump_tables.get(grid)
+    if table is None or table.revision != grid.revision:
+        table = JumpTable(grid)
+        _jump_tables[grid] = table
+    return table
+
+def jump_point_search(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int],
+                      stats: Optional[SearchStats] = None) -> List[Tuple[int, int]]:
+    """Jump Point Search для 4-связной сетки: A* только по точкам прыжка.
+
+    В открытых областях (легкие лабиринты) прямые участки проходятся без добавления
+    клеток в очередь, поэтому раскрывается намного меньше узлов. Длина пути та же, что у a_star.
+    Прыжки берутся из JumpTable, которая строится один раз на ревизию Grid.
+    """
+    if start not in grid.neighbors or goal not in grid.neighbors:
+        return []
+    jump = jump_table(grid).jump
+    goal_x, goal_y = goal
+    h = abs(start[0] - goal_x) + abs(start[1] - goal_y)
+    open_heap = [(h, h, start)]
+    g_score: Dict[Tuple[int, int], int] = {start: 0}
+    came_from: Dict[Tuple[int, int], Tuple[int, int]] = {}
+    closed_set = set()
+    expanded = pushed = peak_frontier = 0
+    path = []
 
-            for neighbor in get_neighbors(current):
-                if neighbor not in visited:
-                    stack.append((neighbor, path + [neighbor]))
+    while open_heap:
+        if len(open_heap) > peak_frontier:
+            peak_frontier = len(open_heap)
+        _, _, current = heapq.heappop(open_heap)
+        if current in closed_set:
+            continue
 
-    return []
+        if current == goal:
+            # Между точками прыжка - прямые отрезки, заполняем их клетками
+            while current != start:
+                parent = came_from[current]
+                x, y = current
+                step_x = (parent[0] > x) - (parent[0] < x)
+                step_y = (parent[1] > y) - (parent[1] < y)
+                while (x, y) != parent:
+                    path.append((x, y))
+                    x += step_x
+                    y += step_y
+                current = parent
+            path.reverse()
+            break
 
-class Node:
-    def __init__(self, position: Tuple[int, int], g: int = 0, h: int = 0):
-        self.position = position
-        self.g = g
-        self.h = h
-        self.f = g + h
-        self.parent = None
+        closed_set.add(current)
+        expanded += 1
+
+        # Отсечение соседей: продолжаем прямо и поворачиваем, назад не идем
+        x, y = current
+        parent = came_from.get(current)
+        if parent is None:
+            directions = DIRECTIONS
+        elif parent[1] == y:
+            dx = 1 if x > parent[0] else -1
+            directions = ((dx, 0), (0, 1), (0, -1))
+        else:
+            dy = 1 if y > parent[1] else -1
+            directions = ((0, dy), (1, 0), (-1, 0))
+
+        g_current = g_score[current]
+        for dx, dy in directions:
+            jump_point = jump(x, y, dx, dy, goal)
+            if jump_point is None:
+                continue
+            g = g_current + abs(jump_point[0] - x) + abs(jump_point[1] - y)
+            if g < g_score.get(jump_point, g + 1):
+                g_score[jump_point] = g
+                came_from[jump_point] = current
+                h = abs(jump_point[0] - goal_x) + abs(jump_point[1] - goal_y)
+                heapq.heappush(open_heap, (g + h, h, jump_point))
+                pushed += 1
+
+    if stats is not None:
+        stats.expanded = expanded
+        stats.pushed = pushed
+        stats.peak_frontier = peak_frontier
+        stats.stored = len(g_score)
+    return path
+
+def _join_paths(forward: Dict, backward: Dict, meeting: Tuple[int, int]) -> List[Tuple[int, int]]:
+    # forward ведет от встречи к старту (у старта None), backward - от встречи к цели
+    path = []
+    current = meeting
+    while forward[current] is not None:
+        path.append(current)
+        current = forward[current]
+    path.reverse()
+    current = backward[meeting]
+    while current is not None:
+        path.append(current)
+        current = backward[current]
+    return path
+
+def bidirectional_bfs(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int],
+                      stats: Optional[SearchStats] = None) -> List[Tuple[int, int]]:
+    """BFS одновременно от старта и от цели; каждый раз целиком раскрывается слой меньшего фронта"""
+    from collections import deque
 
-    def __lt__(self, other):
-        return self.f < other.f
\ No newline at end of file
+    if start not in grid.neighbors or goal not in grid.neighbors:
+        return []
+    if start == goal:
+        return []
+    parents = ({start: None}, {goal: None})
+    distances = ({start: 0}, {goal: 0})
+    frontiers = (deque([start]), deque([goal]))
+    expanded = peak_frontier = 0
+    best, meeting = None, None
+
+    while frontiers[0] and frontiers[1] and meeting is None:
+        if len(frontiers[0]) + len(frontiers[1]) > peak_frontier:
+            peak_frontier = len(frontiers[0]) + len(frontiers[1])
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        queue, parent, distance = frontiers[side], parents[side], distances[side]
+        other_distance = distances[1 - side]
+
+        # Слой раскрывается до конца, чтобы из всех встреч выбрать кратчайшую
+        for _ in range(len(queue)):
+            current = queue.popleft()
+            expanded += 1
+            step = distance[current] + 1
+            for neighbor in grid.get_neighbors(current):
+                if neighbor in other_distance:
+                    total = step + other_distance[neighbor]
+                    if best is None or total < best:
+                        best = total
+                        meeting = neighbor
+                        if neighbor not in parent:
+                            parent[neighbor] = current
+                            distance[neighbor] = step
+                if neighbor not in parent:
+                    parent[neighbor] = current
+                    distance[neighbor] = step
+                    queue.append(neighbor)
+
+    if stats is not None:
+        stats.expanded = expanded
+        stats.pushed = len(parents[0]) + len(parents[1]) - 2
+        stats.peak_frontier = peak_frontier
+        stats.stored = len(parents[0]) + len(parents[1])
+    if meeting is None:
+        return []
+    return _join_paths(parents[0], parents[1], meeting)
+
+def bidirectional_a_star(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int],
+                         stats: Optional[SearchStats] = None) -> List[Tuple[int, int]]:
+    """Двунаправленный A* (вариант NBA*): поиск от старта к цели и от цели к старту.
+
+    Каждый шаг раскрывается сторона с меньшей очередью. best - длина лучшего
+    найденного пути через клетку, достигнутую обеими сторонами. Клетка, раскрытая
+    одной стороной, больше не рассматривается другой, а клетки, через которые путь
+    заведомо не короче best (по эвристике к цели и по минимальному f встречной
+    стороны), не раскрываются. Эвристика согласованная, поэтому путь кратчайший.
+    """
+    if start not in grid.neighbors or goal not in grid.neighbors:
+        return []
+    if start == goal:
+        return []
+    ends = (start, goal)
+    h = abs(start[0] - goal[0]) + abs(start[1] - goal[1])
+    heaps = ([(h, h, start)], [(h, h, goal)])
+    min_f = [h, h]
+    g_scores = ({start: 0}, {goal: 0})
+    parents = ({start: None}, {goal: None})
+    done = set()  # Раскрытые или отброшенные любой стороной
+    expanded = pushed = peak_frontier = 0
+    best, meeting = None, None
+
+    while heaps[0] and heaps[1]:
+        if len(heaps[0]) + len(heaps[1]) > peak_frontier:
+            peak_frontier = len(heaps[0]) + len(heaps[1])
+        if best is not None and max(min_f) >= best:
+            break
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        heap, g_score, parent = heaps[side], g_scores[side], parents[side]
+        other_g = g_scores[1 - side]
+        target_x, target_y = ends[1 - side]
+        origin_x, origin_y = ends[side]
+
+        _, _, current = heapq.heappop(heap)
+        if current not in done:
+            done.add(current)
+            g = g_score[current]
+            x, y = current
+            if best is None or (g + abs(x - target_x) + abs(y - target_y) < best and
+                                g + min_f[1 - side] - abs(x - origin_x) - abs(y - origin_y) < best):
+                expanded += 1
+                g += 1
+                for neighbor in grid.get_neighbors(current):
+                    if neighbor not in done and g < g_score.get(neighbor, g + 1):
+                        g_score[neighbor] = g
+                        parent[neighbor] = current
+                        h = abs(neighbor[0] - target_x) + abs(neighbor[1] - target_y)
+                        heapq.heappush(heap, (g + h, h, neighbor))
+                        pushed += 1
+                        if neighbor in other_g and (best is None or g + other_g[neighbor] < best):
+                            best = g + other_g[neighbor]
+                            meeting = neighbor
+        if heap:
+            min_f[side] = heap[0][0]
+
+    if stats is not None:
+        stats.expanded = expanded
+        stats.pushed = pushed
+        stats.peak_frontier = peak_frontier
+        stats.stored = len(g_scores[0]) + len(g_scores[1])
+    if meeting is None:
+        return []
+    return _join_paths(parents[0], parents[1], meeting)
+
+# Методы поиска, которые можно выбрать через pathfinding_method у Ghost
+PATHFINDERS = {
+    'a_star': a_star,
+    'greedy': greedy_best_first_search,
+    'bfs': bfs,
+    'dfs': dfs,
+    'jps': jump_point_search,
+    'bidirectional_bfs': bidirectional_bfs,
+    'bidirectional_a_star': bidirectional_a_star,
+}
+
+# Методы из PATHFINDERS, которые всегда находят кратчайший путь
+SHORTEST_PATHFINDERS = ('a_star', 'bfs', 'jps', 'bidirectional_bfs', 'bidirectional_a_star')
@@ -0,0 +1,65 @@
+import pygame
+from constants import *
+
+SOUND_PATHS = (EAT_DOT_1, EAT_DOT_0, STARTSOUND, RESTARTSOUND, DEATHSOUND)
+
+
+class SoundBank:
+    """Все звуки игры, декодированные один раз при запуске.
+
+    Пока load() не вызван (или звук выключен, или микшер недоступен), банк
+    работает как пустой: play() и stop() ничего не делают. Так игру можно
+    запускать без звуковой карты и без окна.
+    """
+
+    def __init__(self):
+        self.sounds = {}
+        self.channels = []
+        self.next_channel = 0
+
+    @property
+    def enabled(self):
+        return bool(self.channels)
+
+    def load(self, enabled=SOUND_ENABLED, channel_count=SOUND_CHANNELS):
+        self.sounds = {}
+        self.channels = []
+        self.next_channel = 0
+        if not enabled:
+            return
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            self.sounds = {path: pygame.mixer.Sound(path) for path in SOUND_PATHS}
+        except pygame.error as error:
+            print(f"Звук отключен: {error}")
+            self.sounds = {}
+            return
+        pygame.mixer.set_num_channels(channel_count)
+        self.channels = [pygame.mixer.Channel(i) for i in range(channel_count)]
+
+    def play(self, path, volume=1.0):
+        if not self.channels:
+            return None
+
+        # Берем свободный канал, а если все заняты - следующий по кругу
+        count = len(self.channels)
+        for offset in range(count):
+            index = (self.next_channel + offset) % count
+            if not self.channels[index].get_busy():
+                break
+        else:
+            index = self.next_channel
+        channel = self.channels[index]
+        self.next_channel = (index + 1) % count
+
+        channel.play(self.sounds[path])
+        channel.set_volume(volume)
+        return channel
+
+    def stop(self, path):
+        if self.channels:
+            self.sounds[path].stop()
+
+
+sound_bank = SoundBank()
@@ -0,0 +1,98 @@
+"""Пакетный запуск игр без окна в пуле процессов.
+
+Каждая игра получает свой seed, результаты пишутся в JSONL или CSV
+(по расширению файла) по мере завершения игр. По умолчанию процессов столько же,
+сколько ядер; насколько растет пропускная способность с их числом на конкретной
+машине, показывает python -m benchmarks.batch_scaling.
+
+Запуск из корня репозитория:
+    python batch_runner.py --games 1000 --method a_star --output results.jsonl
+"""
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import time
+from multiprocessing import Pool
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from constants import *
+from algorithms import PATHFINDERS
+from ghost_manager import make_roster
+from simulation import Simulation, RandomController
+
+METHODS = (*PATHFINDERS, 'batched', 'hierarchical')
+FIELDS = ('seed', 'method', 'ghosts', 'score', 'ticks', 'deaths', 'won', 'finished', 'planning_time', 'searches',
+          'paths_reused', 'paths_repaired', 'paths_recomputed',
+          'cache_hits', 'cache_misses', 'cache_evictions', 'wall_time')
+
+
+def run_game(task):
+    seed, method, ghost_count, difficulty, max_ticks = task
+    ghosts = make_roster(ghost_count)
+    if method is not None:
+        ghosts = [dict(entry, pathfinding_method=method) for entry in ghosts]
+
+    started = time.perf_counter()
+    simulation = Simulation(difficulty=difficulty, seed=seed, ghosts=ghosts,
+                            controller=RandomController(random.Random(seed)))
+    result = simulation.run(max_ticks)
+    result['seed'] = seed
+    result['method'] = method or 'default'
+    result['wall_time'] = time.perf_counter() - started
+    return result
+
+
+class ResultWriter:
+    """Пишет результаты в JSONL или CSV, сбрасывая буфер после каждой строки"""
+
+    def __init__(self, path):
+        self.file = open(path, 'w', newline='') if path != '-' else sys.stdout
+        self.csv = None
+        if path.endswith('.csv'):
+            self.csv = csv.DictWriter(self.file, fieldnames=FIELDS, extrasaction='ignore')
+            self.csv.writeheader()
+
+    def write(self, result):
+        if self.csv is not None:
+            self.csv.writerow(result)
+        else:
+            self.file.write(json.dumps({field: result[field] for field in FIELDS}) + '\n')
+        self.file.flush()
+
+    def close(self):
+        if self.file is not sys.stdout:
+            self.file.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0, help='seed первой игры, дальше seed + 1, seed + 2, ...')
+    parser.add_argument('--method', choices=METHODS, default=None, help='метод поиска пути для всех привидений')
+    parser.add_argument('--ghosts', type=int, default=GHOST_COUNT, help='число привидений (ростер по кругу)')
+    parser.add_argument('--difficulty', choices=('easy', 'medium', 'hard'), default=MAZE_DIFFICULTY)
+    parser.add_argument('--max-ticks', type=int, default=FPS * 60 * 5, help='ограничение длины игры в шагах')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--output', default='results.jsonl', help='файл .jsonl или .csv, "-" - stdout')
+    args = parser.parse_args()
+
+    tasks = [(args.seed + i, args.method, args.ghosts, args.difficulty, args.max_ticks) for i in range(args.games)]
+    writer = ResultWriter(args.output)
+    started = time.perf_counter()
+    try:
+        with Pool(args.workers) as pool:
+            for result in pool.imap_unordered(run_game, tasks):
+                writer.write(result)
+    finally:
+        writer.close()
+    elapsed = time.perf_counter() - started
+    print(f"{args.games} игр за {elapsed:.1f} с ({args.games / elapsed:.1f} игр/с, процессов: {args.workers})",
+          file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
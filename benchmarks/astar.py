@@ -0,0 +1,130 @@
+"""Сравнение нового a_star с прежней реализацией на Node-объектах.
+
+Запуск из корня репозитория:
+    python -m benchmarks.astar [--pairs 20] [--seed 1]
+"""
+import argparse
+import heapq
+import random
+import time
+from typing import List, Tuple, Dict
+
+from algorithms import a_star, SearchStats
+from grid import Grid
+from maze import generate_maze
+
+
+class Node:
+    def __init__(self, position: Tuple[int, int], g: int = 0, h: int = 0):
+        self.position = position
+        self.g = g
+        self.h = h
+        self.f = g + h
+        self.parent = None
+
+    def __lt__(self, other):
+        return self.f < other.f
+
+
+class BudgetExceeded(Exception):
+    pass
+
+
+def legacy_a_star(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int], stats: SearchStats,
+                  budget: int = 0) -> List[Tuple[int, int]]:
+    """Прежняя версия a_star: проверка `in` и remove по куче, дубликаты узлов.
+
+    budget ограничивает число раскрытий, иначе на больших лабиринтах замер длится часами.
+    """
+    def heuristic(a: Tuple[int, int], b: Tuple[int, int]) -> int:
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    start_node = Node(start)
+    start_node.h = heuristic(start, goal)
+    open_list = [start_node]
+    closed_set = set()
+    came_from: Dict[Tuple[int, int], Node] = {}
+
+    while open_list:
+        stats.peak_frontier = max(stats.peak_frontier, len(open_list))
+        current = heapq.heappop(open_list)
+
+        if current.position == goal:
+            path = []
+            while current.position != start:
+                path.append(current.position)
+                current = came_from[current.position]
+            path.reverse()
+            return path
+
+        closed_set.add(current.position)
+        stats.expanded += 1
+        if budget and stats.expanded > budget:
+            raise BudgetExceeded
+
+        for neighbor_pos in grid.get_neighbors(current.position):
+            if neighbor_pos in closed_set:
+                continue
+
+            neighbor = Node(neighbor_pos, current.g + 1)
+            neighbor.h = heuristic(neighbor_pos, goal)
+
+            if neighbor not in open_list:
+                came_from[neighbor_pos] = current
+                heapq.heappush(open_list, neighbor)
+                stats.pushed += 1
+            elif neighbor.g < current.g:
+                came_from[neighbor_pos] = current
+                open_list.remove(neighbor)
+                heapq.heappush(open_list, neighbor)
+                stats.pushed += 1
+
+    return []
+
+
+def run_case(name, grid, pairs, budget):
+    for label, search in (('legacy', legacy_a_star), ('a_star', a_star)):
+        total = SearchStats()
+        lengths = 0
+        finished = 0
+        started = time.perf_counter()
+        for start, goal in pairs:
+            stats = SearchStats()
+            try:
+                if search is legacy_a_star:
+                    path = search(grid, start, goal, stats, budget)
+                else:
+                    path = search(grid, start, goal, stats)
+            except BudgetExceeded:
+                continue
+            finally:
+                total.expanded += stats.expanded
+                total.pushed += stats.pushed
+                total.peak_frontier = max(total.peak_frontier, stats.peak_frontier)
+            lengths += len(path)
+            finished += 1
+        elapsed = time.perf_counter() - started
+        print(f"{name:>8} {label:>7}: {elapsed * 1000:10.1f} мс, раскрыто {total.expanded:9}, "
+              f"в очередь {total.pushed:9}, пик фронта {total.peak_frontier:7}, "
+              f"завершено {finished}/{len(pairs)}, сумма длин {lengths}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pairs', type=int, default=20, help='число пар старт/цель на лабиринт')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--legacy-budget', type=int, default=20000,
+                        help='максимум раскрытий прежней версии на один поиск (0 - без ограничения)')
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    for width, height in ((27, 29), (500, 500)):
+        maze = generate_maze(width, height, seed=args.seed)
+        grid = Grid(maze)
+        cells = grid.walkable_cells()
+        pairs = [(random.choice(cells), random.choice(cells)) for _ in range(args.pairs)]
+        run_case(f"{width}x{height}", grid, pairs, args.legacy_budget)
+
+
+if __name__ == '__main__':
+    main()
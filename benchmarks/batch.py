@@ -0,0 +1,46 @@
+"""Стоимость планирования на кадр: отдельный a_star на каждое привидение против batch_paths.
+
+Запуск из корня репозитория:
+    python -m benchmarks.batch [--size 101] [--frames 20] [--seed 1]
+"""
+import argparse
+import random
+import time
+
+from algorithms import a_star, batch_paths
+from grid import Grid
+from maze import generate_maze
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=101, help='ширина и высота лабиринта')
+    parser.add_argument('--frames', type=int, default=20, help='число кадров (целей) на замер')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    grid = Grid(generate_maze(args.size, args.size))
+    cells = grid.walkable_cells()
+    goals = [random.choice(cells) for _ in range(args.frames)]
+
+    for ghost_count in (2, 4, 16, 100):
+        starts = [random.choice(cells) for _ in range(ghost_count)]
+
+        started = time.perf_counter()
+        for goal in goals:
+            for start in starts:
+                a_star(grid, start, goal)
+        separate = (time.perf_counter() - started) / args.frames
+
+        started = time.perf_counter()
+        for goal in goals:
+            batch_paths(grid, starts, goal)
+        batched = (time.perf_counter() - started) / args.frames
+
+        print(f"{ghost_count:4} привидений: a_star на каждого {separate * 1000:8.2f} мс/кадр, "
+              f"batch_paths {batched * 1000:8.2f} мс/кадр")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Масштабирование batch_runner по числу процессов.
+
+Один и тот же набор игр (seed, seed + 1, ...) прогоняется пулом из 1, 2, 4, ...
+процессов; печатаются игры в секунду, ускорение относительно первого замера и
+эффективность (ускорение / процессов). Замеры с процессами сверх os.cpu_count()
+помечаются: там ускорения ждать не стоит.
+
+Запуск из корня репозитория:
+    python -m benchmarks.batch_scaling [--games 32] [--workers 1 2 4 8] [--ghosts 4]
+"""
+import argparse
+import os
+import time
+from multiprocessing import Pool
+
+from batch_runner import run_game
+from constants import FPS, MAZE_DIFFICULTY
+
+
+def default_workers():
+    workers = [1]
+    while workers[-1] * 2 <= (os.cpu_count() or 1):
+        workers.append(workers[-1] * 2)
+    return workers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=32)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, nargs='+', default=default_workers())
+    parser.add_argument('--method', default=None, help='метод поиска пути для всех привидений')
+    parser.add_argument('--ghosts', type=int, default=None, help='число привидений (ростер по кругу)')
+    parser.add_argument('--difficulty', choices=('easy', 'medium', 'hard'), default=MAZE_DIFFICULTY)
+    parser.add_argument('--max-ticks', type=int, default=FPS * 60)
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    print(f"Ядер: {cpus}, игр в замере: {args.games}")
+    tasks = [(args.seed + i, args.method, args.ghosts, args.difficulty, args.max_ticks) for i in range(args.games)]
+    baseline = None
+    for workers in args.workers:
+        started = time.perf_counter()
+        with Pool(workers) as pool:
+            for _ in pool.imap_unordered(run_game, tasks):
+                pass
+        elapsed = time.perf_counter() - started
+        throughput = args.games / elapsed
+        if baseline is None:
+            baseline = throughput
+        speedup = throughput / baseline
+        note = ' (процессов больше, чем ядер)' if workers > cpus else ''
+        print(f"{workers:3} процессов: {throughput:7.2f} игр/с, ускорение x{speedup:.2f}, "
+              f"эффективность {speedup / workers * 100:5.1f}%{note}")
+
+
+if __name__ == '__main__':
+    main()
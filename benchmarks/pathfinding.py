@@ -0,0 +1,149 @@
+"""Сравнение алгоритмов поиска пути из algorithms.py.
+
+Для каждого размера и сложности лабиринта все алгоритмы проходят один и тот же
+набор пар старт/цель. Считаются время, раскрытые узлы, пиковый размер фронта,
+пиковая память (tracemalloc и число клеток в словарях поиска) и оптимальность
+пути относительно BFS. Предрасчет, который поиск делает один раз на ревизию Grid
+(таблица прыжков jps), меряется отдельно и в время запросов не входит. Результат
+можно сохранить в JSON и сравнить со старым прогоном через --baseline.
+
+Запуск из корня репозитория:
+    python -m benchmarks.pathfinding --json bench.json
+    python -m benchmarks.pathfinding --baseline bench.json
+"""
+import argparse
+import json
+import platform
+import random
+import time
+import tracemalloc
+
+from algorithms import PATHFINDERS, JumpTable, SearchStats, bfs, jump_table
+from grid import Grid
+from maze import generate_maze
+
+# Предрасчеты на ревизию Grid: (построение с кэшированием для поиска, построение заново для замера памяти)
+PREPARE = {'jps': (jump_table, JumpTable)}
+
+
+def prepare_algorithm(name, grid):
+    """Время (мс) и память (байты) предрасчета алгоритма; после вызова он уже в кэше"""
+    if name not in PREPARE:
+        return 0.0, 0
+    cached, fresh = PREPARE[name]
+    tracemalloc.start()
+    fresh(grid)
+    memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    started = time.perf_counter()
+    cached(grid)
+    return (time.perf_counter() - started) * 1000, memory
+
+
+def run_algorithm(name, search, grid, pairs, shortest):
+    prepare_ms, prepare_memory = prepare_algorithm(name, grid)
+    stats = SearchStats()
+    expanded = stored = peak_frontier = 0
+    elapsed = 0.0
+    lengths = []
+    for start, goal in pairs:
+        started = time.perf_counter()
+        path = search(grid, start, goal, stats)
+        elapsed += time.perf_counter() - started
+        expanded += stats.expanded
+        stored = max(stored, stats.stored)
+        peak_frontier = max(peak_frontier, stats.peak_frontier)
+        lengths.append(len(path))
+
+    # Память меряем отдельным проходом: tracemalloc сильно замедляет поиск
+    peak_memory = 0
+    for start, goal in pairs:
+        tracemalloc.start()
+        search(grid, start, goal)
+        peak_memory = max(peak_memory, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    found = [(length, best) for length, best in zip(lengths, shortest) if best is not None]
+    optimal = sum(1 for length, best in found if length == best)
+    total_length = sum(length for length, _ in found)
+    total_best = sum(best for _, best in found)
+    return {
+        'algorithm': name,
+        'time_ms': elapsed * 1000,
+        'time_per_query_ms': elapsed * 1000 / len(pairs),
+        'expanded': expanded,
+        'expanded_per_query': expanded / len(pairs),
+        'peak_memory_bytes': peak_memory,
+        'peak_stored_cells': stored,
+        'peak_frontier': peak_frontier,
+        'optimal_fraction': optimal / len(found) if found else 1.0,
+        'length_ratio': total_length / total_best if total_best else 1.0,
+        'prepare_ms': prepare_ms,
+        'prepare_memory_bytes': prepare_memory,
+    }
+
+
+def make_pairs(grid, count, rng):
+    cells = grid.walkable_cells()
+    return [(rng.choice(cells), rng.choice(cells)) for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[27, 101, 201])
+    parser.add_argument('--difficulties', nargs='+', default=['easy', 'medium', 'hard'])
+    parser.add_argument('--algorithms', nargs='+', default=list(PATHFINDERS), choices=list(PATHFINDERS))
+    parser.add_argument('--pairs', type=int, default=20, help='число пар старт/цель на лабиринт')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--json', help='куда сохранить результаты')
+    parser.add_argument('--baseline', help='JSON прошлого прогона для сравнения времени')
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as file:
+            for row in json.load(file)['results']:
+                baseline[(row['size'], row['difficulty'], row['algorithm'])] = row
+
+    results = []
+    for size in args.sizes:
+        for difficulty in args.difficulties:
+            grid = Grid(generate_maze(size, size, difficulty, seed=args.seed))
+            pairs = make_pairs(grid, args.pairs, random.Random(args.seed))
+            shortest = []
+            for start, goal in pairs:
+                path = bfs(grid, start, goal)
+                shortest.append(len(path) if path or start == goal else None)
+
+            for name in args.algorithms:
+                row = run_algorithm(name, PATHFINDERS[name], grid, pairs, shortest)
+                row.update(size=size, difficulty=difficulty, pairs=len(pairs))
+                results.append(row)
+
+                line = (f"{size:5} {difficulty:>6} {name:>7}: {row['time_per_query_ms']:9.3f} мс/запрос, "
+                        f"раскрыто {row['expanded_per_query']:10.1f}, фронт {row['peak_frontier']:6}, память {row['peak_memory_bytes'] / 1024:9.1f} КБ, "
+                        f"оптимальных {row['optimal_fraction'] * 100:5.1f}%, длина x{row['length_ratio']:.2f}")
+                if row['prepare_ms']:
+                    line += f", предрасчет {row['prepare_ms']:.1f} мс и {row['prepare_memory_bytes'] / 1024:.0f} КБ"
+                old = baseline.get((size, difficulty, name))
+                if old is not None and old['time_ms']:
+                    line += f", время x{row['time_ms'] / old['time_ms']:.2f} к baseline"
+                print(line)
+
+    if args.json:
+        report = {
+            'meta': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'seed': args.seed,
+                'pairs': args.pairs,
+                'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            },
+            'results': results,
+        }
+        with open(args.json, 'w') as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""Отрисовка с грязными прямоугольниками (DirtyRectRenderer) против полной перерисовки кадра.
+
+Одна и та же игра с фиксированным seed и случайным управлением проигрывается
+дважды: с DirtyRectRenderer и с полной перерисовкой, как в run.main. В первом
+проходе экран каждые --check-every кадров сравнивается попиксельно с кадром,
+нарисованным целиком. Без дисплея работает через SDL_VIDEODRIVER=dummy.
+
+Запуск из корня репозитория:
+    python -m benchmarks.rendering [--frames 1500] [--check-every 10] [--seed 3]
+"""
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from constants import *
+from renderer import DirtyRectRenderer
+from run import draw_lives, draw_maze, draw_points
+from simulation import RandomController, Simulation
+
+
+def make_simulation(seed):
+    return Simulation(seed=seed, headless=False, controller=RandomController(random.Random(seed)))
+
+
+def draw_full(surface, simulation):
+    surface.fill(BLACK)
+    draw_maze(surface, simulation.maze)
+    simulation.pacman.draw(surface)
+    simulation.ghost_manager.draw(surface)
+    draw_points(surface, simulation.pacman.points)
+    draw_lives(surface, simulation.pacman.lives)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--frames', type=int, default=1500)
+    parser.add_argument('--check-every', type=int, default=10, help='как часто сравнивать кадр попиксельно')
+    parser.add_argument('--seed', type=int, default=3)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    print(f"SDL: {pygame.display.get_driver()}")
+
+    simulation = make_simulation(args.seed)
+    pacman = simulation.pacman
+    renderer = DirtyRectRenderer(screen, simulation.grid)
+    reference = pygame.Surface(screen.get_size())
+
+    def draw_hud(surface):
+        draw_points(surface, pacman.points)
+        draw_lives(surface, pacman.lives)
+
+    elapsed = 0.0
+    frames = checked = mismatched = 0
+    while frames < args.frames and not simulation.finished:
+        simulation.step()
+        started = time.perf_counter()
+        renderer.draw_frame([pacman, *simulation.ghosts], (pacman.points, pacman.lives), draw_hud)
+        elapsed += time.perf_counter() - started
+        frames += 1
+        if frames % args.check_every == 0:
+            draw_full(reference, simulation)
+            checked += 1
+            if pygame.image.tostring(screen, 'RGB') != pygame.image.tostring(reference, 'RGB'):
+                mismatched += 1
+    dirty_time = elapsed / max(frames, 1)
+
+    # Полная перерисовка той же игры, как в run.main при DIRTY_RECT_RENDERING = False
+    simulation = make_simulation(args.seed)
+    elapsed = 0.0
+    full_frames = 0
+    while full_frames < frames and not simulation.finished:
+        simulation.step()
+        started = time.perf_counter()
+        draw_full(screen, simulation)
+        pygame.display.flip()
+        elapsed += time.perf_counter() - started
+        full_frames += 1
+    full_time = elapsed / max(full_frames, 1)
+
+    print(f"{frames} кадров, очков {pacman.points}; кадров с расхождением пикселей: {mismatched} из {checked}")
+    print(f"грязные прямоугольники: {dirty_time * 1000:.3f} мс/кадр")
+    print(f"полная перерисовка:     {full_time * 1000:.3f} мс/кадр (x{full_time / dirty_time:.1f})")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+import math
+
+import pygame
+from constants import *
+
+
+class EntityRegistry:
+    """Реестр игровых объектов с индексом занятости клеток (spatial hash).
+
+    Каждый объект лежит в корзине клетки, в которой находится центр его rect.
+    Чтобы найти столкновения, достаточно посмотреть клетку объекта и ее соседей,
+    поэтому проверка не зависит от общего числа привидений, фруктов и т.д.
+    Объекты должны иметь rect и radius (как для pygame.sprite.collide_circle).
+    """
+
+    def __init__(self, cell_size=GRID_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}     # клетка -> {объект: вид}
+        self.entities = {}  # объект -> (вид, клетка)
+        self.max_radius = 0
+
+    def cell_of(self, entity):
+        x, y = entity.rect.center
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def add(self, entity, kind):
+        cell = self.cell_of(entity)
+        self.entities[entity] = (kind, cell)
+        self.cells.setdefault(cell, {})[entity] = kind
+        self.max_radius = max(self.max_radius, entity.radius)
+
+    def remove(self, entity):
+        kind, cell = self.entities.pop(entity)
+        bucket = self.cells[cell]
+        del bucket[entity]
+        if not bucket:
+            del self.cells[cell]
+
+    def move(self, entity):
+        """Перекладывает объект в корзину новой клетки; вызывать после каждого перемещения"""
+        kind, cell = self.entities[entity]
+        new_cell = self.cell_of(entity)
+        if new_cell != cell:
+            self.remove(entity)
+            self.entities[entity] = (kind, new_cell)
+            self.cells.setdefault(new_cell, {})[entity] = kind
+
+    def nearby(self, entity, kind=None):
+        """Объекты нужного вида из клеток, до которых может дотянуться entity"""
+        reach = math.ceil((entity.radius + self.max_radius) / self.cell_size)
+        cx, cy = self.cell_of(entity)
+        cells = self.cells
+        for y in range(cy - reach, cy + reach + 1):
+            for x in range(cx - reach, cx + reach + 1):
+                bucket = cells.get((x, y))
+                if bucket:
+                    for other, other_kind in bucket.items():
+                        if other is not entity and (kind is None or other_kind == kind):
+                            yield other
+
+    def colliding(self, entity, kind=None):
+        """Объекты, которые касаются entity (проверка - pygame.sprite.collide_circle)"""
+        return [other for other in self.nearby(entity, kind) if pygame.sprite.collide_circle(entity, other)]
@@ -2,12 +2,20 @@ SCALE_FACTOR = 1.25
 SCREEN_WIDTH, SCREEN_HEIGHT = int(540 * SCALE_FACTOR), int(660 * SCALE_FACTOR)
 GRID_SIZE = int(20 * SCALE_FACTOR)
 FPS = 60
+MAX_STEPS_PER_FRAME = 5 # Сколько шагов симуляции можно догнать за один кадр
 PACMAN_SPEED = int(3 * SCALE_FACTOR)
 GHOST_SPEED = PACMAN_SPEED * 20
 SPRITE_SIZE = int(13 * SCALE_FACTOR)
 ANIMATION_SPEED = 0.05
 LIVES = 3
 MAZE_DIFFICULTY = "medium" # easy/medium/hard
+MAZE_SEED = None # Число для воспроизводимого лабиринта, None - каждый раз новый
+DIRTY_RECT_RENDERING = True # Перерисовывать только изменившиеся области экрана
+PROFILE_TRACE_PATH = None # Например "trace.json": трасса кадров сохранится при выходе
+INCREMENTAL_REPLANNING = True # Чинить старый путь привидения, а не искать заново (погоня тогда идет по Path, а не LazyPath)
+PATH_CACHE_SIZE = 256 # Сколько путей хранит общий кэш привидений; 0 - без кэша
+USE_NAVIGATION_TABLE = False # Предрассчитанные кратчайшие пути для привидений с кратчайшими методами (память ~ клеток^2)
+COMPACT_GRID = None # 'bytearray' или 'numpy': копия клеток в Grid для запросов ко всему полю (+1 байт на клетку); None - без копии
 
 FONT = "fonts/Retro Gaming.ttf"
 
@@ -20,11 +28,23 @@ BLINKY = 'sprites/blinky.png'
 CLYDE = 'sprites/clyde.png'
 INKY = 'sprites/inky.png'
 
+# Привидения: скин, множитель скорости и метод поиска пути (ключ algorithms.PATHFINDERS, 'batched' или 'hierarchical').
+# 'hierarchical' (граф развилок) стоит выбирать только для больших лабиринтов с MAZE_DIFFICULTY = 'hard'
+GHOST_ROSTER = [
+    {'skin': CLYDE, 'speed_multiplier': 60, 'pathfinding_method': 'a_star'},
+    {'skin': PINKY, 'speed_multiplier': 60, 'pathfinding_method': 'greedy'},
+]
+GHOST_COUNT = None # Число привидений; ростер повторяется по кругу. None - ровно GHOST_ROSTER
+GHOST_LINE_OF_SIGHT = 'straight' # 'straight' - только по строке/столбцу, 'bresenham' - по любой прямой
+GHOST_WANDER_RADIUS = None # Радиус (в клетках) случайных целей блуждающего привидения; None - весь лабиринт
+
 EAT_DOT_1 = "sounds/eat_dot_1.wav"
 EAT_DOT_0 = "sounds/eat_dot_0.wav"
 STARTSOUND = "sounds/start.wav"
 RESTARTSOUND = "sounds/restart.wav"
 DEATHSOUND = "sounds/death_0.wav"
+SOUND_ENABLED = True # False - без звука (например, для запуска без окна)
+SOUND_CHANNELS = 8
 
 BLACK = (0, 0, 0)
 BLUE = (0, 0, 155)
@@ -4,12 +4,28 @@ import heapq
 from typing import List, Tuple, Dict
 import random
 import math
+import time
 from algorithms import *
+from grid import Grid
+from sprites import sprite_atlas
+from paths import Path, LazyPath
+from planner import PathRepairer, SHORTEST_METHODS
+from visibility import VisibilityMap, line_offsets
 
 class Ghost(pygame.sprite.Sprite):
-    def __init__(self, maze, speed_multiplier=1.2, skin=BLINKY, pathfinding_method='a_star'):
+    def __init__(self, maze, speed_multiplier=1.2, skin=BLINKY, pathfinding_method='a_star', navigation=None, grid=None, planner=None,
+                 headless=False, rng=None, visibility=None, junctions=None, path_cache=None):
         super().__init__()
         self.maze = maze
+        self.headless = headless  # Без окна: спрайты не загружаются, вместо них None
+        self.rng = rng if rng is not None else random  # Свой random.Random делает поведение воспроизводимым
+        self.grid = grid if grid is not None else Grid(maze)  # Общий Grid лучше передавать из main
+        self.navigation = navigation  # Необязательная NavigationTable: шаг за O(1) для кратчайших методов
+        self.planner = planner  # SharedPathPlanner для pathfinding_method='batched'
+        self.junctions = junctions  # Общий JunctionGraph для pathfinding_method='hierarchical' (его создает GhostManager)
+        self.path_cache = path_cache  # Необязательный PathCache, общий для всех привидений
+        self.repairer = PathRepairer(self.grid) if INCREMENTAL_REPLANNING else None
+        self.visibility = visibility if visibility is not None else VisibilityMap(self.grid)  # Общую лучше передавать
         self.radius = GRID_SIZE // 2
         self.sprites = self.load_ghost_sprites(skin)
         self.current_sprite = self.sprites[0]
@@ -25,11 +41,13 @@ class Ghost(pygame.sprite.Sprite):
         self.speed = PACMAN_SPEED * speed_multiplier  # Увеличиваем скорость привидения
         self.is_dead = False
         self.death_sprites = self.load_ghost_death_sprites()
-        self.path = []
+        self.path = Path()
         self.next_target = None
         self.path_update_timer = 0
         self.path_update_interval = 1  # Обновляем путь каждые 0.25 секунд
         self.stuck_timer = 0
+        self.stuck_counter = 0  # Сколько секунд подряд привидение не может сдвинуться
+        self.last_successful_move = None
         self.stuck_threshold = 0.5  # Считаем, что привидение застряло после 0.5 секунд
         self.last_position = (self.x, self.y)
         self.sight_range = 10  # Диапазон видимости привидения в клетках
@@ -37,6 +55,8 @@ class Ghost(pygame.sprite.Sprite):
         self.can_see_pacman = False
         self.pathfinding_method = pathfinding_method
         self.max_stuck_time = 1.0
+        self.planning_time = 0.0  # Суммарное время поиска пути в секундах
+        self.searches = 0
 
     def move_towards_target(self):
         if self.next_target:
@@ -94,7 +114,7 @@ class Ghost(pygame.sprite.Sprite):
                 self.x = target_px_x
                 self.y = target_px_y
                 if self.path:
-                    self.next_target = self.path.pop(0)
+                    self.next_target = self.path.pop_next()
                 else:
                     self.next_target = None
                 self.stuck_counter = 0
@@ -118,62 +138,30 @@ class Ghost(pygame.sprite.Sprite):
             self.dy = 1 if dy > 0 else (-1 if dy < 0 else 0)
 
     def can_see(self, pacman):
-        """Проверяет, видит ли привидение Пакмана, по прямой линии (простая проверка видимости)"""
-        ghost_x, ghost_y = int(self.x // GRID_SIZE), int(self.y // GRID_SIZE)
-        pacman_x, pacman_y = int(pacman.x // GRID_SIZE), int(pacman.y // GRID_SIZE)
+        """Проверяет, видит ли привидение Пакмана (по прямой строке/столбцу или по линии Брезенхема)"""
+        ghost_cell = (int(self.x // GRID_SIZE), int(self.y // GRID_SIZE))
+        pacman_cell = (int(pacman.x // GRID_SIZE), int(pacman.y // GRID_SIZE))
 
-        if ghost_x == pacman_x or ghost_y == pacman_y:
-            # Проверяем, нет ли стен между привидением и Пакманом
-            if self.is_clear_path(ghost_x, ghost_y, pacman_x, pacman_y):
-                return True
-        return False
+        self.visibility.refresh()
+        if GHOST_LINE_OF_SIGHT == 'bresenham':
+            return self.visibility.line_of_sight(ghost_cell, pacman_cell)
+        return self.visibility.can_see(ghost_cell, pacman_cell)
 
     def is_clear_path(self, x1, y1, x2, y2):
         """Проверяет, есть ли прямая видимость между двумя точками"""
-        if x1 == x2:
-            # Вертикальная проверка
-            for y in range(min(y1, y2), max(y1, y2) + 1):
-                if self.maze[y][x1] == 1:  # Если есть стена
-                    return False
-        elif y1 == y2:
-            # Горизонтальная проверка
-            for x in range(min(x1, x2), max(x1, x2) + 1):
-                if self.maze[y1][x] == 1:
-                    return False
-        return True
+        if x1 != x2 and y1 != y2:
+            return True
+        self.visibility.refresh()
+        return self.visibility.can_see((x1, y1), (x2, y2))
 
     def is_line_of_sight_clear(self, start: Tuple[int, int], goal: Tuple[int, int]) -> bool:
         """Проверка, не преграждают ли стены путь от привидения к Pac-Man"""
-        x1, y1 = start
-        x2, y2 = goal
-        line_points = self.bresenham(x1, y1, x2, y2)
-        for x, y in line_points:
-            if self.maze[y][x] == 1:  # Если на пути есть стена
-                return False
-        return True
+        self.visibility.refresh()
+        return self.visibility.line_of_sight(start, goal)
 
     def bresenham(self, x1, y1, x2, y2) -> List[Tuple[int, int]]:
         """Алгоритм Брезенхема для расчета всех клеток на линии между двумя точками"""
-        points = []
-        dx = abs(x2 - x1)
-        dy = abs(y2 - y1)
-        sx = 1 if x1 < x2 else -1
-        sy = 1 if y1 < y2 else -1
-        err = dx - dy
-
-        while True:
-            points.append((x1, y1))
-            if x1 == x2 and y1 == y2:
-                break
-            e2 = err * 2
-            if e2 > -dy:
-                err -= dy
-                x1 += sx
-            if e2 < dx:
-                err += dx
-                y1 += sy
-
-        return points
+        return [(x1 + dx, y1 + dy) for dx, dy in line_offsets(x2 - x1, y2 - y1)]
 
     def distance_to(self, pacman) -> float:
         """Расчет расстояния до Pac-Man в клетках"""
@@ -197,46 +185,25 @@ class Ghost(pygame.sprite.Sprite):
         else:
             start = (int(self.x // GRID_SIZE), int(self.y // GRID_SIZE))
 
-        possible_targets = self.get_possible_targets()
-        if possible_targets:
-            goal = random.choice(possible_targets)
-            if self.pathfinding_method == 'a_star':
-                self.path = a_star(start, goal)
-            elif self.pathfinding_method == 'greedy':
-                self.path = greedy_best_first_search(start, goal)
-            elif self.pathfinding_method == 'bfs':
-                self.path = bfs(start, goal)
-            elif self.pathfinding_method == 'dfs':
-                self.path = dfs(start, goal)
+        # Случайная цель берется из индекса проходимых клеток Grid, без обхода поля
+        if GHOST_WANDER_RADIUS is None:
+            goal = self.grid.random_walkable(self.rng)
+        else:
+            goal = self.grid.random_walkable_within(self.rng, start, GHOST_WANDER_RADIUS)
+        if goal is not None:
+            self.path = self.plan_path(start, goal)
 
             if self.path:
-                self.next_target = self.path.pop(0)
+                self.next_target = self.path.pop_next()
             else:
                 self.set_random_adjacent_target()
         else:
             self.set_random_adjacent_target()
 
-    def set_random_adjacent_target(self):
-        current_x, current_y = int(self.x // GRID_SIZE), int(self.y // GRID_SIZE)
-        possible_targets = [
-            (current_x + 1, current_y),
-            (current_x - 1, current_y),
-            (current_x, current_y + 1),
-            (current_x, current_y - 1)
-        ]
-        valid_targets = [t for t in possible_targets if self.is_valid_position(t[0], t[1])]
-        if valid_targets:
-            self.next_target = random.choice(valid_targets)
-            self.path = [self.next_target]  # Обновляем путь
-        else:
-            # Если нет валидных целей, пересчитываем путь
-            self.recalculate_path()
-
-    # Остальные методы остаются без изменений...
-
     def check_if_stuck(self, dt):
         if self.stuck_counter >= self.max_stuck_time:
-            print("Привидение застряло, телепортируем на точку спавна.")
+            if not self.headless:
+                print("Привидение застряло, телепортируем на точку спавна.")
             self.teleport_to_spawn()
             self.stuck_counter = 0
 
@@ -246,23 +213,87 @@ class Ghost(pygame.sprite.Sprite):
         self.rect.topleft = (self.x - self.radius, self.y - self.radius)
         self.set_random_adjacent_target()  # Задаем новый случайный маршрут
 
-    def get_possible_targets(self):
-        targets = []
-        for y in range(len(self.maze)):
-            for x in range(len(self.maze[0])):
-                if self.is_valid_position(x, y):
-                    targets.append((x, y))
-        return targets
+    def teleport_to_random_position(self):
+        cell = self.grid.random_walkable(self.rng)
+        if cell is None:
+            return  # Проходимых клеток нет вовсе: стоим на месте
+        self.x = (cell[0] + 0.5) * GRID_SIZE
+        self.y = (cell[1] + 0.5) * GRID_SIZE
+        self.rect.topleft = (self.x - self.radius, self.y - self.radius)
+        self.next_target = None
+        self.path = Path()
 
-    def is_valid_position(self, x, y):
-        return (0 <= x < len(self.maze[0]) and 0 <= y < len(self.maze) and
-                self.maze[y][x] != 1)  # 1 представляет стены в лабиринте
+    def get_possible_targets(self):
+        return self.grid.walkable_cells()
 
     def can_move(self, x, y):
         grid_x, grid_y = int(x // GRID_SIZE), int(y // GRID_SIZE)
         return self.is_valid_position(grid_x, grid_y)
 
 
+    def find_path(self, start, goal):
+        started = time.perf_counter()
+        path = self.search_path(start, goal)
+        self.planning_time += time.perf_counter() - started
+        self.searches += 1
+        return path
+
+    def plan_path(self, start, goal):
+        """Как find_path, но возвращает Path; по таблице навигации и дереву 'batched' путь разворачивается лениво"""
+        started = time.perf_counter()
+        path = self.lazy_path(start, goal)
+        if path is None:
+            path = Path(self.search_path(start, goal))
+        self.planning_time += time.perf_counter() - started
+        self.searches += 1
+        return path
+
+    def navigation_step(self, start, goal):
+        """Функция следующего шага по NavigationTable или None, если таблица не подходит.
+
+        Таблица дает кратчайшие пути, поэтому используется только вместо методов,
+        которые и сами ищут кратчайший путь; greedy и dfs всегда ищут своим способом.
+        """
+        navigation = self.navigation
+        if navigation is None or self.pathfinding_method not in SHORTEST_METHODS:
+            return None
+        navigation.refresh(self.grid)  # Дешево: сравнивается только ревизия
+        if start not in navigation.index:
+            return None
+        return lambda cell: navigation.next_step(cell, goal)
+
+    def lazy_path(self, start, goal):
+        next_step = self.navigation_step(start, goal)
+        if next_step is not None:
+            return LazyPath(next_step, start)
+        if self.pathfinding_method == 'batched' and self.planner is not None:
+            tree = self.planner.tree(goal)
+            tree.reach((start,))
+            return LazyPath(tree.next_step.get, start)
+        return None
+
+    def search_path(self, start, goal):
+        next_step = self.navigation_step(start, goal)
+        if next_step is not None:
+            return list(LazyPath(next_step, start))
+        if self.path_cache is not None:
+            return self.path_cache.get(self.pathfinding_method, start, goal, lambda: self.run_search(start, goal))
+        return self.run_search(start, goal)
+
+    def run_search(self, start, goal):
+        if self.pathfinding_method == 'batched':
+            if self.planner is not None:
+                return self.planner.path(start, goal)
+            return bfs(self.grid, start, goal)
+        if self.pathfinding_method == 'hierarchical':
+            if self.junctions is not None:
+                return self.junctions.path(start, goal)
+            return a_star(self.grid, start, goal)
+        search = PATHFINDERS.get(self.pathfinding_method)
+        if search is None:
+            return []
+        return search(self.grid, start, goal)
+
     def update_path(self, pacman):
         start = (int(self.x // GRID_SIZE), int(self.y // GRID_SIZE))
         if self.can_see(pacman):
@@ -271,17 +302,13 @@ class Ghost(pygame.sprite.Sprite):
 
         if self.last_seen_pacman:
             goal = self.last_seen_pacman
-            if self.pathfinding_method == 'a_star':
-                self.path = a_star(start, goal)
-            elif self.pathfinding_method == 'greedy':
-                self.path = greedy_best_first_search(start, goal)
-            elif self.pathfinding_method == 'bfs':
-                self.path = bfs(start, goal)
-            elif self.pathfinding_method == 'dfs':
-                self.path = dfs(start, goal)
+            if self.repairer is not None:
+                self.path = self.repairer.plan(self.pathfinding_method, start, goal, self.find_path)
+            else:
+                self.path = self.plan_path(start, goal)
 
         if self.path:
-            self.next_target = self.path.pop(0)
+            self.next_target = self.path.pop_next()
         else:
             self.set_random_adjacent_target()
 
@@ -295,8 +322,8 @@ class Ghost(pygame.sprite.Sprite):
         ]
         valid_targets = [t for t in possible_targets if self.is_valid_position(t[0], t[1])]
         if valid_targets:
-            self.next_target = random.choice(valid_targets)
-            self.path = [self.next_target]  # Обновляем путь
+            self.next_target = self.rng.choice(valid_targets)
+            self.path = Path([self.next_target])  # Обновляем путь
         else:
             # Если нет валидных целей, попробуем найти любую свободную клетку
             for dx in range(-2, 3):
@@ -304,15 +331,14 @@ class Ghost(pygame.sprite.Sprite):
                     new_x, new_y = current_x + dx, current_y + dy
                     if self.is_valid_position(new_x, new_y):
                         self.next_target = (new_x, new_y)
-                        self.path = [self.next_target]
+                        self.path = Path([self.next_target])
                         return
             
             # Если все еще нет валидных целей, телепортируем привидение на случайную свободную клетку
             self.teleport_to_random_position()
 
     def is_valid_position(self, x, y):
-        return (0 <= x < len(self.maze[0]) and 0 <= y < len(self.maze) and
-                self.maze[y][x] != 1)  # 1 представляет стены в лабиринте
+        return self.grid.is_passable(x, y)
 
     def handle_animation(self, dt):
         self.time_since_last_update += dt
@@ -331,17 +357,7 @@ class Ghost(pygame.sprite.Sprite):
                 self.current_sprite = self.sprites[self.frame + direction * 2]
 
     def load_ghost_sprites(self, skin):
-        spritesheet = pygame.image.load(skin).convert_alpha()
-        sprites = []
-        sprite_size = 14
-        sheet_width, sheet_height = 28, 56
-        for y in range(0, sheet_height, sprite_size):
-            for x in range(0, sheet_width, sprite_size):
-                rect = pygame.Rect(x, y, sprite_size, sprite_size)
-                sprite = spritesheet.subsurface(rect)
-                sprite = pygame.transform.scale(sprite, (SPRITE_SIZE, SPRITE_SIZE))
-                sprites.append(sprite)
-        return sprites
+        return sprite_atlas.get_frames(skin, 14, 28, 56, self.headless)
 
     def find_spawn_point(self, maze):
         height = len(maze)
@@ -364,20 +380,7 @@ class Ghost(pygame.sprite.Sprite):
         return center_x, center_y
 
     def load_ghost_death_sprites(self):
-        spritesheet = pygame.image.load(GHOST_DEATH_PATH).convert_alpha()
-        sprites = []
-        
-        sprite_size = 14  # Установите размер спрайтов
-        sheet_width, sheet_height = 28, 14  # Установите размеры спрайтщита
-        
-        for y in range(0, sheet_height, sprite_size):
-            for x in range(0, sheet_width, sprite_size):
-                rect = pygame.Rect(x, y, sprite_size, sprite_size)
-                sprite = spritesheet.subsurface(rect)
-                sprite = pygame.transform.scale(sprite, (SPRITE_SIZE, SPRITE_SIZE))
-                sprites.append(sprite)
-        
-        return sprites
+        return sprite_atlas.get_frames(GHOST_DEATH_PATH, 14, 28, 14, self.headless)
 
     def try_change_direction(self):
         new_x = self.x + self.next_direction[0] * self.speed
@@ -413,26 +416,4 @@ class Ghost(pygame.sprite.Sprite):
         self.death_animation_finished = False  # Сброс флага при новой смерти
 
     def draw(self, screen):
-        screen.blit(self.current_sprite, (int(self.x - SPRITE_SIZE / 2), int(self.y - SPRITE_SIZE / 2)))
-
-class Node:
-    def __init__(self, position: Tuple[int, int], g: int = 0, h: int = 0):
-        self.position = position
-        self.g = g
-        self.h = h
-        self.f = g + h
-        self.parent = None
-
-    def __lt__(self, other):
-        return self.f < other.f
-    
-class Node:
-    def __init__(self, position: Tuple[int, int], g: int = 0, h: int = 0):
-        self.position = position
-        self.g = g
-        self.h = h
-        self.f = g + h
-        self.parent = None
-
-    def __lt__(self, other):
-        return self.f < other.f
\ No newline at end of file
+        return screen.blit(self.current_sprite, (int(self.x - SPRITE_SIZE / 2), int(self.y - SPRITE_SIZE / 2)))
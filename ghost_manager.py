@@ -0,0 +1,83 @@
+from itertools import cycle, islice
+
+from constants import *
+from ghost import Ghost
+from grid import Grid
+from junctions import JunctionGraph
+
+
+def make_roster(count=GHOST_COUNT, roster=GHOST_ROSTER):
+    """Ростер из count привидений: записи roster повторяются по кругу"""
+    if count is None:
+        return list(roster)
+    return list(islice(cycle(roster), count))
+
+
+class GhostManager:
+    """Все привидения уровня, построенные из ростера и обновляемые одним вызовом.
+
+    Пересчет пути у привидений разнесен по кадрам: таймеры стартуют со сдвигом,
+    поэтому при 64 привидениях поиск пути не приходится на один и тот же кадр.
+    Остальные параметры (grid, planner, navigation, headless, rng) передаются
+    в каждый Ghost. Если в ростере есть 'hierarchical', а junctions не передан,
+    менеджер сам строит один общий JunctionGraph; close() отписывает его от Grid.
+    """
+
+    def __init__(self, maze, roster=None, junctions=None, **ghost_options):
+        if roster is None:
+            roster = make_roster()
+        self.owns_junctions = False
+        if junctions is None and any(entry.get('pathfinding_method') == 'hierarchical' for entry in roster):
+            if ghost_options.get('grid') is None:
+                ghost_options['grid'] = Grid(maze)
+            junctions = JunctionGraph(ghost_options['grid'])
+            self.owns_junctions = True
+        self.junctions = junctions
+        self.ghosts = [Ghost(maze, entry.get('speed_multiplier', 1.2), entry.get('skin', BLINKY),
+                             pathfinding_method=entry.get('pathfinding_method', 'a_star'),
+                             junctions=junctions, **ghost_options)
+                       for entry in roster]
+        for i, ghost in enumerate(self.ghosts):
+            ghost.path_update_timer = ghost.path_update_interval * i / len(self.ghosts)
+
+    def close(self):
+        """Отписывает от Grid граф развилок, который менеджер построил сам"""
+        if self.owns_junctions:
+            self.junctions.close()
+            self.owns_junctions = False
+
+    def __iter__(self):
+        return iter(self.ghosts)
+
+    def __len__(self):
+        return len(self.ghosts)
+
+    def update(self, dt, pacman):
+        for ghost in self.ghosts:
+            ghost.update(dt, pacman)
+
+    def die(self):
+        for ghost in self.ghosts:
+            ghost.die()
+
+    def reset_after_death(self):
+        for ghost in self.ghosts:
+            ghost.reset_after_death()
+
+    def draw(self, screen):
+        return [ghost.draw(screen) for ghost in self.ghosts]
+
+    @property
+    def planning_time(self):
+        return sum(ghost.planning_time for ghost in self.ghosts)
+
+    @property
+    def searches(self):
+        return sum(ghost.searches for ghost in self.ghosts)
+
+    def repair_stats(self):
+        """Суммарные счетчики PathRepairer: (reused, repaired, recomputed)"""
+        repairers = [ghost.repairer for ghost in self.ghosts if ghost.repairer is not None]
+        return (sum(repairer.reused for repairer in repairers),
+                sum(repairer.repaired for repairer in repairers),
+                sum(repairer.recomputed for repairer in repairers))
@@ -0,0 +1,192 @@
+from bisect import bisect_left, bisect_right, insort
+from math import isqrt
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен: без него клетки хранятся в bytearray
+    np = None
+
+# Порядок соседей, в котором их перебирают алгоритмы поиска
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+WALL = 1
+DOT = 2
+
+# Таблицы для bytes.translate: превращают клетки в маску 0/1 без цикла на Python
+_WALL_TABLE = bytes(int(value == WALL) for value in range(256))
+_DOT_TABLE = bytes(int(value == DOT) for value in range(256))
+
+
+class Grid:
+    """Обертка над лабиринтом с заранее рассчитанными списками соседей.
+
+    Сам лабиринт (список строк) не копируется: Grid работает с тем же объектом,
+    что и PacMan/Ghost. По желанию (compact='bytearray' или 'numpy') параллельно
+    хранится компактная копия клеток для запросов ко всему полю без цикла на Python.
+    Это дополнительный байт на клетку сверх списков, а не замена им, поэтому по
+    умолчанию копии нет и запросы собирают байты из строк лабиринта. Без NumPy
+    'numpy' работает как 'bytearray'. Менять клетки нужно через set_cell, чтобы
+    обновились соседи, компактная копия и номер ревизии.
+
+    Проходимые клетки также лежат в индексе: в списке walkable (для случайной
+    клетки за O(1)) и в отсортированных по x списках для каждой строки (для
+    выборки клеток в радиусе через bisect). Индекс обновляется в set_cell.
+    """
+
+    def __init__(self, maze, compact: Optional[str] = None):
+        self.maze = maze
+        self.width = len(maze[0])
+        self.height = len(maze)
+        self.revision = 0  # Увеличивается при каждом изменении проходимости
+        self.numpy = compact == 'numpy' and np is not None
+        self.cells = None  # Компактная копия: uint8-массив NumPy, bytearray или None
+        if compact:
+            self.cells = self._pack()
+        self.changed_cells = None  # Список для записи измененных клеток (включает DirtyRectRenderer)
+        self.listeners: List[Callable[[int, int], None]] = []  # Вызываются после изменения проходимости клетки
+        self.neighbors: Dict[Tuple[int, int], Tuple[Tuple[int, int], ...]] = {}
+        for y in range(self.height):
+            for x in range(self.width):
+                if maze[y][x] != 1:
+                    self.neighbors[(x, y)] = self._collect_neighbors(x, y)
+
+        self.walkable: List[Tuple[int, int]] = list(self.neighbors)
+        self.walkable_index: Dict[Tuple[int, int], int] = {pos: i for i, pos in enumerate(self.walkable)}
+        self.row_cells: List[List[int]] = [[] for _ in range(self.height)]
+        for x, y in self.walkable:
+            self.row_cells[y].append(x)  # Клетки идут по строкам слева направо, списки уже отсортированы
+
+    def _collect_neighbors(self, x: int, y: int) -> Tuple[Tuple[int, int], ...]:
+        maze = self.maze
+        return tuple((nx, ny) for nx, ny in ((x + dx, y + dy) for dx, dy in DIRECTIONS)
+                     if 0 <= nx < self.width and 0 <= ny < self.height and maze[ny][nx] != 1)
+
+    def _pack(self):
+        flat = self._flat()
+        if self.numpy:
+            return np.frombuffer(flat, dtype=np.uint8).reshape(self.height, self.width).copy()
+        return bytearray(flat)
+
+    def _flat(self) -> bytes:
+        # Все клетки одной строкой байт (по строкам лабиринта)
+        if self.cells is None:
+            return b''.join(bytes(row) for row in self.maze)
+        return self.cells.tobytes() if self.numpy else bytes(self.cells)
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def is_passable(self, x: int, y: int) -> bool:
+        return (x, y) in self.neighbors
+
+    def get_neighbors(self, pos: Tuple[int, int]) -> Tuple[Tuple[int, int], ...]:
+        return self.neighbors.get(pos, ())
+
+    def walkable_cells(self) -> List[Tuple[int, int]]:
+        """Индекс проходимых клеток без копии: только для чтения, set_cell меняет его порядок"""
+        return self.walkable
+
+    def random_walkable(self, rng) -> Optional[Tuple[int, int]]:
+        """Случайная проходимая клетка (равновероятно) без обхода поля"""
+        if not self.walkable:
+            return None
+        return self.walkable[rng.randrange(len(self.walkable))]
+
+    def _row_spans(self, center: Tuple[int, int], radius: int):
+        # Для каждой строки круга: (y, индекс первой и за последней клетки в row_cells[y])
+        cx, cy = center
+        for y in range(max(cy - radius, 0), min(cy + radius, self.height - 1) + 1):
+            half = isqrt(radius * radius - (y - cy) ** 2)
+            row = self.row_cells[y]
+            low, high = bisect_left(row, cx - half), bisect_right(row, cx + half)
+            if low < high:
+                yield y, low, high
+
+    def walkable_within(self, center: Tuple[int, int], radius: int) -> List[Tuple[int, int]]:
+        """Проходимые клетки на расстоянии не больше radius (по прямой) от center"""
+        return [(x, y) for y, low, high in self._row_spans(center, radius) for x in self.row_cells[y][low:high]]
+
+    def random_walkable_within(self, rng, center: Tuple[int, int], radius: int) -> Optional[Tuple[int, int]]:
+        """Случайная клетка из walkable_within без построения всего списка"""
+        spans = list(self._row_spans(center, radius))
+        total = sum(high - low for _, low, high in spans)
+        if not total:
+            return None
+        k = rng.randrange(total)
+        for y, low, high in spans:
+            if k < high - low:
+                return self.row_cells[y][low + k], y
+            k -= high - low
+
+    def cell(self, x: int, y: int) -> int:
+        return self.maze[y][x]
+
+    def count(self, value: int) -> int:
+        if self.cells is None:
+            return sum(row.count(value) for row in self.maze)
+        if self.numpy:
+            return int(np.count_nonzero(self.cells == value))
+        return self.cells.count(value)
+
+    def dot_count(self) -> int:
+        return self.count(DOT)
+
+    def wall_mask(self):
+        """Маска стен: bool-массив height x width (compact='numpy') или плоские bytes из 0/1"""
+        if self.numpy:
+            return self.cells == WALL
+        return self._flat().translate(_WALL_TABLE)
+
+    def dot_mask(self):
+        if self.numpy:
+            return self.cells == DOT
+        return self._flat().translate(_DOT_TABLE)
+
+    def fill_dots(self):
+        """Ставит точки во все пустые клетки: замена идет в байтах, строки лабиринта берутся из них"""
+        width = self.width
+        if self.numpy:
+            self.cells[self.cells == 0] = DOT
+            rows = self.cells.tolist()
+        else:
+            flat = self._flat().replace(b'\x00', bytes([DOT]))
+            if self.cells is not None:
+                self.cells = bytearray(flat)
+            rows = [list(flat[y * width:(y + 1) * width]) for y in range(self.height)]
+        self.maze[:] = rows  # Тот же объект лабиринта, что у PacMan/Ghost, с новыми строками
+
+    def set_cell(self, x: int, y: int, value: int):
+        was_passable = self.maze[y][x] != 1
+        self.maze[y][x] = value
+        if self.numpy:
+            self.cells[y, x] = value
+        elif self.cells is not None:
+            self.cells[y * self.width + x] = value
+        if self.changed_cells is not None:
+            self.changed_cells.append((x, y))
+        if was_passable == (value != 1):
+            return  # Точки не меняют проходимость, соседи остаются прежними
+
+        if value == 1:
+            del self.neighbors[(x, y)]
+            # Удаление из walkable за O(1): на место клетки ставим последнюю
+            index = self.walkable_index.pop((x, y))
+            last = self.walkable.pop()
+            if last != (x, y):
+                self.walkable[index] = last
+                self.walkable_index[last] = index
+            row = self.row_cells[y]
+            del row[bisect_left(row, x)]
+        else:
+            self.neighbors[(x, y)] = self._collect_neighbors(x, y)
+            self.walkable_index[(x, y)] = len(self.walkable)
+            self.walkable.append((x, y))
+            insort(self.row_cells[y], x)
+        for dx, dy in DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if (nx, ny) in self.neighbors:
+                self.neighbors[(nx, ny)] = self._collect_neighbors(nx, ny)
+        self.revision += 1
+        for listener in self.listeners:
+            listener(x, y)
@@ -0,0 +1,53 @@
+from collections import OrderedDict
+
+import pygame
+from constants import *
+
+
+class TextCache:
+    """Пул шрифтов и кэш отрисованных надписей для HUD.
+
+    Каждый размер шрифта загружается один раз, а поверхность с надписью
+    рендерится заново только для нового сочетания текста, размера и цвета.
+    """
+
+    def __init__(self, font_path=FONT, max_entries=256):
+        self.font_path = font_path
+        self.max_entries = max_entries
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size):
+        font = self.fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(self.font_path, size)
+            self.fonts[size] = font
+        return font
+
+    def render(self, text, size, color=WHITE):
+        key = (text, size, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.font(size).render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Сбрасывает шрифты и надписи: после pygame.quit() они становятся недействительными"""
+        self.fonts.clear()
+        self.surfaces.clear()
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'fonts': len(self.fonts), 'entries': len(self.surfaces)}
+
+
+text_cache = TextCache()
@@ -0,0 +1,224 @@
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+from algorithms import SearchStats
+from grid import Grid, DIRECTIONS
+
+INFINITY = float('inf')
+
+
+class JunctionGraph:
+    """Граф развилок: коридоры лабиринта свернуты в взвешенные ребра.
+
+    Узлы - проходимые клетки, у которых не ровно два соседа (развилки и тупики), а
+    также по одной клетке в кольцевых коридорах без развилок. Ребро - коридор между
+    двумя узлами, его вес равен числу шагов. Поиск идет по узлам (A* с
+    манхэттенской эвристикой), а в клетки разворачивается только найденный путь.
+    Граф подписан на Grid.listeners: при изменении клетки перестраиваются только
+    коридоры, которые проходят через нее или ее соседей; close() снимает подписку.
+
+    Выигрыш есть только на сложных лабиринтах (difficulty='hard'), где коридоры
+    длинные: на 201x201 запрос примерно вдвое быстрее a_star. На легких
+    лабиринтах узлов почти столько же, сколько клеток, и поиск медленнее a_star.
+    """
+
+    def __init__(self, grid: Grid):
+        self.grid = grid
+        self.nodes = set()
+        self.edges: Dict[int, Tuple[Tuple[int, int], Tuple[int, int], Tuple[Tuple[int, int], ...]]] = {}
+        self.adjacency: Dict[Tuple[int, int], Dict[int, None]] = {}  # узел -> ребра (dict ради порядка)
+        self.exits: Dict[Tuple[Tuple[int, int], Tuple[int, int]], int] = {}  # (узел, первая клетка) -> ребро
+        self.corridor: Dict[Tuple[int, int], Tuple[int, int]] = {}  # клетка коридора -> (ребро, номер в нем)
+        self.next_edge = 0
+        self.rebuilt_edges = 0  # Сколько ребер перестроено после изменений клеток
+        self.build()
+        grid.listeners.append(self.cell_changed)
+
+    def close(self):
+        if self.cell_changed in self.grid.listeners:
+            self.grid.listeners.remove(self.cell_changed)
+
+    def build(self):
+        neighbors = self.grid.neighbors
+        self.nodes = {cell for cell, cell_neighbors in neighbors.items() if len(cell_neighbors) != 2}
+        for cell in neighbors:
+            if cell in self.nodes:
+                self.connect(cell)
+        self.anchor(neighbors)
+
+    def anchor(self, cells):
+        # Клетки, не попавшие ни в один коридор, лежат в кольце без развилок: делаем узлом одну из них
+        for cell in cells:
+            if cell in self.grid.neighbors and cell not in self.nodes and cell not in self.corridor:
+                self.nodes.add(cell)
+                self.connect(cell)
+
+    def connect(self, node: Tuple[int, int]):
+        """Проходит коридоры из node во все стороны, для которых еще нет ребра"""
+        for first in self.grid.get_neighbors(node):
+            if (node, first) not in self.exits:
+                self.walk(node, first)
+
+    def walk(self, node: Tuple[int, int], first: Tuple[int, int]):
+        neighbors = self.grid.neighbors
+        nodes = self.nodes
+        cells = []
+        previous, current = node, first
+        while current not in nodes:
+            cells.append(current)
+            a, b = neighbors[current]
+            previous, current = current, (b if a == previous else a)
+
+        edge = self.next_edge
+        self.next_edge += 1
+        self.edges[edge] = (node, current, tuple(cells))
+        self.exits[(node, first)] = edge
+        self.exits[(current, previous)] = edge
+        self.adjacency.setdefault(node, {})[edge] = None
+        self.adjacency.setdefault(current, {})[edge] = None
+        for i, cell in enumerate(cells):
+            self.corridor[cell] = (edge, i)
+
+    def remove_edge(self, edge: int):
+        a, b, cells = self.edges.pop(edge)
+        self.exits.pop((a, cells[0] if cells else b), None)
+        self.exits.pop((b, cells[-1] if cells else a), None)
+        self.adjacency.get(a, {}).pop(edge, None)
+        self.adjacency.get(b, {}).pop(edge, None)
+        for cell in cells:
+            del self.corridor[cell]
+        return a, b, cells
+
+    def cell_changed(self, x: int, y: int):
+        """Локальная перестройка: меняется число соседей только у клетки и ее соседей"""
+        neighbors = self.grid.neighbors
+        dirty = [(x, y)] + [(x + dx, y + dy) for dx, dy in DIRECTIONS]
+
+        removed = {}
+        for cell in dirty:
+            if cell in self.corridor:
+                removed[self.corridor[cell][0]] = None
+            removed.update(self.adjacency.get(cell, {}))
+
+        endpoints = []
+        orphans = []
+        for edge in removed:
+            a, b, cells = self.remove_edge(edge)
+            endpoints += (a, b)
+            orphans += cells
+        self.rebuilt_edges += len(removed)
+
+        for cell in dirty:
+            if cell in neighbors and len(neighbors[cell]) != 2:
+                self.nodes.add(cell)
+            else:
+                self.nodes.discard(cell)
+                self.adjacency.pop(cell, None)
+
+        for cell in endpoints + dirty:
+            if cell in self.nodes:
+                self.connect(cell)
+        self.anchor(orphans + dirty)
+
+    def attach(self, cell: Tuple[int, int]):
+        """Как выйти из клетки в граф: [(узел, шагов, клетки пути после cell до узла включительно)]"""
+        if cell in self.nodes:
+            return [(cell, 0, [])]
+        edge, i = self.corridor[cell]
+        a, b, cells = self.edges[edge]
+        return [(a, i + 1, cells[i - 1::-1] + (a,) if i else (a,)),
+                (b, len(cells) - i, cells[i + 1:] + (b,))]
+
+    def path(self, start: Tuple[int, int], goal: Tuple[int, int],
+             stats: Optional[SearchStats] = None) -> List[Tuple[int, int]]:
+        """Кратчайший путь в формате a_star: без стартовой клетки, с целью в конце"""
+        neighbors = self.grid.neighbors
+        if start == goal or start not in neighbors or goal not in neighbors:
+            return []
+
+        # Участки от узлов до цели: путь после узла до цели включительно
+        targets: Dict[Tuple[int, int], Tuple[int, tuple]] = {}
+        for node, cost, leg in self.attach(goal):
+            if cost < targets.get(node, (INFINITY,))[0]:
+                targets[node] = (cost, tuple(reversed(leg[:-1])) + (goal,) if cost else ())
+
+        # Лучший вариант: либо прямо по общему коридору (direct), либо через узел best_node
+        best_cost, best_node, direct = INFINITY, None, None
+        if start in self.corridor and goal in self.corridor:
+            edge, i = self.corridor[start]
+            goal_edge, j = self.corridor[goal]
+            if edge == goal_edge:
+                cells = self.edges[edge][2]
+                best_cost = abs(i - j)
+                direct = cells[i + 1:j + 1] if i < j else cells[i - 1:j - 1 if j else None:-1]
+
+        goal_x, goal_y = goal
+        g_score: Dict[Tuple[int, int], int] = {}
+        came_from: Dict[Tuple[int, int], tuple] = {}
+        open_heap = []
+        for node, cost, leg in self.attach(start):
+            if cost < g_score.get(node, INFINITY):
+                g_score[node] = cost
+                came_from[node] = (None, leg)
+                h = abs(node[0] - goal_x) + abs(node[1] - goal_y)
+                heapq.heappush(open_heap, (cost + h, h, node))
+        closed_set = set()
+        expanded = peak_frontier = 0
+        pushed = len(open_heap)
+        edges = self.edges
+
+        while open_heap:
+            if len(open_heap) > peak_frontier:
+                peak_frontier = len(open_heap)
+            f, _, node = heapq.heappop(open_heap)
+            if f >= best_cost:
+                break
+            if node in closed_set:
+                continue
+            closed_set.add(node)
+            expanded += 1
+
+            g = g_score[node]
+            target = targets.get(node)
+            if target is not None and g + target[0] < best_cost:
+                best_cost, best_node = g + target[0], node
+
+            for edge in self.adjacency.get(node, ()):
+                a, b, cells = edges[edge]
+                other = b if node == a else a
+                if len(neighbors[other]) == 1 and other not in targets:
+                    continue  # Тупик не ведет дальше, раскрывать его незачем
+                new_g = g + len(cells) + 1
+                if new_g < g_score.get(other, INFINITY):
+                    g_score[other] = new_g
+                    came_from[other] = (node, edge)
+                    h = abs(other[0] - goal_x) + abs(other[1] - goal_y)
+                    heapq.heappush(open_heap, (new_g + h, h, other))
+                    pushed += 1
+
+        if stats is not None:
+            stats.expanded = expanded
+            stats.pushed = pushed
+            stats.peak_frontier = peak_frontier
+            stats.stored = len(g_score)
+
+        if best_node is None:
+            return list(direct) if direct is not None else []
+
+        # Разворачиваем в клетки только найденный путь: от цели назад к старту
+        node = best_node
+        legs = [targets[node][1]]
+        while True:
+            previous, link = came_from[node]
+            if previous is None:
+                legs.append(link)
+                break
+            a, b, cells = edges[link]
+            legs.append((cells if previous == a else cells[::-1]) + (node,))
+            node = previous
+        return [cell for leg in reversed(legs) for cell in leg]
+
+    def report(self) -> str:
+        cells = len(self.grid.neighbors)
+        return (f"Граф развилок: {len(self.nodes)} узлов и {len(self.edges)} ребер на {cells} клеток "
+                f"(в {cells / max(len(self.nodes), 1):.1f} раза меньше узлов)")
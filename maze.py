@@ -1,67 +1,87 @@
 import random
-from constants import MAZE_DIFFICULTY
 
-def generate_maze(width, height, diff="medium"):
-    # Определяем сложность
-    if diff == "hard":
-        difficulty = 0.1
-    elif diff == "medium":
-        difficulty = 0.25
-    elif diff == "easy":
-        difficulty = 0.4
+# Доля внутренних стен, которые удаляются после генерации
+DIFFICULTY_WALL_REMOVAL = {"hard": 0.1, "medium": 0.25, "easy": 0.4}
 
-    # Создаем лабиринт, заполненный стенами
-    maze = [[1 for _ in range(width)] for _ in range(height)]
 
-    # Начальная точка
-    start_x, start_y = 1, 1
-    maze[start_y][start_x] = 0  # Начинаем с прохода
+def generate_maze(width, height, diff="medium", seed=None):
+    # Определяем сложность
+    difficulty = DIFFICULTY_WALL_REMOVAL[diff]
+    rng = random.Random(seed)
 
-    # Функция для проверки соседей
-    def get_neighbors(x, y):
-        neighbors = []
-        if x > 1 and maze[y][x-2] == 1:  # Сосед слева
-            neighbors.append((x - 2, y))
-        if x < width - 2 and maze[y][x+2] == 1:  # Сосед справа
-            neighbors.append((x + 2, y))
-        if y > 1 and maze[y-2][x] == 1:  # Сосед сверху
-            neighbors.append((x, y - 2))
-        if y < height - 2 and maze[y+2][x] == 1:  # Сосед снизу
-            neighbors.append((x, y + 2))
-        random.shuffle(neighbors)  # Перемешиваем для случайности
-        return neighbors
+    # Узлы поиска в глубину - клетки с нечетными координатами внутри рамки:
+    # узел (column, row) с нуля - это клетка (2 * column + 1, 2 * row + 1)
+    columns = max((width - 1) // 2, 1)
+    rows = max((height - 1) // 2, 1)
 
-    # Рекурсивная функция для генерации лабиринта (поиск в глубину)
-    def carve_passages(x, y):
-        for nx, ny in get_neighbors(x, y):
-            if maze[ny][nx] == 1:  # Если это стена
-                maze[ny][nx] = 0  # Пробиваем проход
-                maze[(y + ny) // 2][(x + nx) // 2] = 0  # Пробиваем между стенами
-                carve_passages(nx, ny)
+    # Отметки о посещении узлов с рамкой из уже "посещенных": так не нужны проверки границ
+    stride = columns + 2
+    visited = bytearray([1]) * (stride * (rows + 2))
+    for row in range(rows):
+        start = (row + 1) * stride + 1
+        visited[start:start + columns] = bytes(columns)
 
-    # Запускаем генерацию
-    carve_passages(start_x, start_y)
+    # Ходы: влево, вправо, вверх, вниз. Варианты по маске посещенных соседей (бит i - ход i):
+    # непосещенные, в порядке ходов
+    steps = (-1, 1, -stride, stride)
+    options_by_mask = [tuple(i for i in range(4) if not mask >> i & 1) for mask in range(16)]
 
-    # Добавляем дополнительные проходы в зависимости от сложности
-    for y in range(1, height - 1):
-        for x in range(1, width - 1):
-            if maze[y][x] == 1 and random.random() < difficulty:
-                # Удаляем дополнительные стены для уменьшения сложности
-                maze[y][x] = 0  
+    # Поиск в глубину с явным стеком вместо рекурсии, начинаем с узла (1, 1). Проход не
+    # пробивается по ходу поиска: для каждого узла запоминается ход, которым в него пришли
+    # (4 - корень), а клетки потом строятся из этих ходов целыми строками
+    came = bytearray([4]) * len(visited)
+    current = stride + 1
+    visited[current] = 1
+    stack = []
+    rand = rng.random
 
-    return maze
+    while True:
+        options = options_by_mask[visited[current - 1] | visited[current + 1] << 1 |
+                                  visited[current - stride] << 2 | visited[current + stride] << 3]
+        if options:
+            stack.append(current)
+            move = options[int(rand() * len(options))]
+            current += steps[move]
+            visited[current] = 1
+            came[current] = move
+        elif stack:
+            current = stack.pop()
+        else:
+            break
 
-# Пример использования
-maze = generate_maze(27, 29, diff=MAZE_DIFFICULTY)
+    # Клетки строк узлов, стены между соседними узлами строки и стены между строками узлов.
+    # Стена открыта, если через нее прошел поиск: вправо в правый узел или влево в левый
+    # (вниз в нижний или вверх в верхний). Маски 0/1 объединяются через большие числа.
+    # Лабиринт хранится плоским массивом, клетка (x, y) - это индекс y * width + x
+    cells = bytearray([1]) * (width * height)
+    opened = bytes((1, 0)) + bytes(254)  # Маска 0/1 -> клетка: стена 1 или проход 0
+    came_by = [bytes(int(code == move) for code in range(256)) for move in range(4)]
+    previous = None
+    for row in range(rows):
+        codes = came[(row + 1) * stride + 1:(row + 1) * stride + 1 + columns]
+        y = (2 * row + 1) * width
+        cells[y + 1:y + 2 * columns:2] = bytes(columns)
+        if columns > 1:
+            left = int.from_bytes(codes[:-1].translate(came_by[0]), 'big')
+            right = int.from_bytes(codes[1:].translate(came_by[1]), 'big')
+            cells[y + 2:y + 2 * columns - 1:2] = (left | right).to_bytes(columns - 1, 'big').translate(opened)
+        if previous is not None:
+            up = int.from_bytes(previous.translate(came_by[2]), 'big')
+            down = int.from_bytes(codes.translate(came_by[3]), 'big')
+            cells[y - width + 1:y - width + 2 * columns:2] = (up | down).to_bytes(columns, 'big').translate(opened)
+        previous = codes
 
-# maze = [
-#     [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-#     [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1],
-#     [1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 1],
-#     [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1],
-#     [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-# ]
+    # Добавляем дополнительные проходы в зависимости от сложности. Шум - байты из того же
+    # rng, поэтому один seed всегда дает один лабиринт; стена внутри поля удаляется, если
+    # ее байт меньше difficulty * 256. Все операции идут над полем целиком, без цикла по клеткам
+    threshold = round(difficulty * 256)
+    removable = bytearray(rng.randbytes(width * height).translate(bytes(int(v < threshold) for v in range(256))))
+    removable[:width] = bytes(width)
+    removable[-width:] = bytes(width)
+    removable[::width] = bytes(height)
+    removable[width - 1::width] = bytes(height)
+    # В клетках только 0 и 1, поэтому побитовое "стена и не удаляется" над большим числом
+    # дает то же, что поклеточная проверка
+    cells = (int.from_bytes(cells, 'big') & ~int.from_bytes(removable, 'big')).to_bytes(width * height, 'big')
 
-# Печать лабиринта
-for row in maze:
-    print(row)
+    return [list(cells[y * width:(y + 1) * width]) for y in range(height)]
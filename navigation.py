@@ -0,0 +1,127 @@
+import sys
+import time
+from array import array
+from collections import deque
+from typing import List, Tuple, Optional
+from grid import Grid, DIRECTIONS
+
+NO_STEP = 255
+
+
+class NavigationTable:
+    """Таблица расстояний и первых шагов между всеми проходимыми клетками лабиринта.
+
+    Строится один раз после generate_maze: для каждой клетки-цели запускается BFS,
+    после чего следующий шаг привидения к цели - это просто обращение к таблице.
+    Память растет как квадрат числа проходимых клеток, поэтому для больших полей
+    стоит сначала посмотреть на estimate_memory().
+    """
+
+    def __init__(self, grid: Grid):
+        self.build(grid)
+
+    @staticmethod
+    def estimate_memory(grid: Grid) -> int:
+        """Объем таблицы в байтах (как memory_bytes после build) без ее построения"""
+        n = len(grid.neighbors)
+        distance_size = 2 if n < 0xFFFF else 4
+        # Таблицы плюс список клеток и словарь их номеров: те же контейнеры строятся за O(n)
+        return (n * n * (distance_size + 1) + sys.getsizeof(list(grid.walkable_cells())) +
+                sys.getsizeof({i: i for i in range(n)}))
+
+    def build(self, grid: Grid):
+        start_time = time.perf_counter()
+        self.grid = grid
+        self.revision = grid.revision
+
+        self.cells: List[Tuple[int, int]] = list(grid.walkable_cells())  # Своя копия: индекс Grid меняется
+        self.index = {cell: i for i, cell in enumerate(self.cells)}
+        n = len(self.cells)
+
+        # Соседи каждой клетки в виде (индекс соседа, направление к нему)
+        neighbors = []
+        for x, y in self.cells:
+            cell_neighbors = []
+            for direction, (dx, dy) in enumerate(DIRECTIONS):
+                neighbor = self.index.get((x + dx, y + dy))
+                if neighbor is not None:
+                    cell_neighbors.append((neighbor, direction))
+            neighbors.append(cell_neighbors)
+
+        if n < 0xFFFF:
+            typecode, self.unreachable = 'H', 0xFFFF
+        else:
+            typecode, self.unreachable = 'I', 0xFFFFFFFF
+        unreachable = self.unreachable
+
+        # Строка таблицы соответствует цели, столбец - клетке, из которой идем
+        distances = array(typecode, [unreachable]) * (n * n)
+        steps = bytearray([NO_STEP]) * (n * n)
+
+        for goal in range(n):
+            row = goal * n
+            distances[row + goal] = 0
+            queue = deque([goal])
+            while queue:
+                current = queue.popleft()
+                distance = distances[row + current] + 1
+                for neighbor, direction in neighbors[current]:
+                    if distances[row + neighbor] == unreachable:
+                        distances[row + neighbor] = distance
+                        # Из соседа шагаем обратно к current: противоположное направление
+                        steps[row + neighbor] = direction ^ 1
+                        queue.append(neighbor)
+
+        self.distances = distances
+        self.steps = steps
+        self.build_time = time.perf_counter() - start_time
+
+    def is_stale(self, grid: Grid) -> bool:
+        return grid is not self.grid or grid.revision != self.revision
+
+    def refresh(self, grid: Grid) -> bool:
+        """Перестраивает таблицу, если стены изменились. Возвращает True при перестройке"""
+        if self.is_stale(grid):
+            self.build(grid)
+            return True
+        return False
+
+    def distance(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[int]:
+        start_index = self.index.get(start)
+        goal_index = self.index.get(goal)
+        if start_index is None or goal_index is None:
+            return None
+        distance = self.distances[goal_index * len(self.cells) + start_index]
+        return None if distance == self.unreachable else distance
+
+    def next_step(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        start_index = self.index.get(start)
+        goal_index = self.index.get(goal)
+        if start_index is None or goal_index is None:
+            return None
+        direction = self.steps[goal_index * len(self.cells) + start_index]
+        if direction == NO_STEP:
+            return None
+        dx, dy = DIRECTIONS[direction]
+        return start[0] + dx, start[1] + dy
+
+    def path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Путь в том же формате, что и у a_star: без стартовой клетки, с целью в конце"""
+        path = []
+        current = start
+        while current != goal:
+            current = self.next_step(current, goal)
+            if current is None:
+                return []
+            path.append(current)
+        return path
+
+    @property
+    def memory_bytes(self) -> int:
+        return (self.distances.itemsize * len(self.distances) + len(self.steps) +
+                sys.getsizeof(self.cells) + sys.getsizeof(self.index))
+
+    def report(self) -> str:
+        return (f"Навигационная таблица: {len(self.cells)} клеток, "
+                f"построена за {self.build_time:.3f} с, "
+                f"{self.memory_bytes / (1024 * 1024):.2f} МБ")
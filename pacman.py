@@ -1,9 +1,14 @@
 import pygame
 from constants import *
+from grid import Grid
+from audio import sound_bank
+from sprites import sprite_atlas
 
 class PacMan(pygame.sprite.Sprite):
-    def __init__(self, maze):
+    def __init__(self, maze, grid=None, headless=False):
         self.maze = maze
+        self.headless = headless  # Без окна: спрайты не загружаются, вместо них None
+        self.grid = grid if grid is not None else Grid(maze)
         self.radius = GRID_SIZE // 2
         self.dx = 0
         self.evenAndOdd = True
@@ -22,43 +27,15 @@ class PacMan(pygame.sprite.Sprite):
         self.is_dead = False
         self.death_animation_finished = False
         self.lives = LIVES
-        self.total_dot = self.count_food(maze)
+        self.total_dot = self.count_food()
 
         self.rect = pygame.Rect(self.x - self.radius, self.y - self.radius, 2 * self.radius, 2 * self.radius)
 
     def load_pacman_sprites(self):
-        spritesheet = pygame.image.load(PACMAN_MOVING_PATH).convert_alpha()
-        sprites = []
-        
-        sprite_size = 13  # Установите размер спрайтов
-        sheet_width, sheet_height = 52, 52  # Установите размеры спрайтщита
-        
-        for y in range(0, sheet_height, sprite_size):
-            for x in range(0, sheet_width, sprite_size):
-                rect = pygame.Rect(x, y, sprite_size, sprite_size)
-                sprite = spritesheet.subsurface(rect)
-                sprite = pygame.transform.scale(sprite, (SPRITE_SIZE, SPRITE_SIZE))
-                sprites.append(sprite)
-        
-        return sprites
-    
-    
+        return sprite_atlas.get_frames(PACMAN_MOVING_PATH, 13, 52, 52, self.headless)
+
     def load_pacman_death_sprites(self):
-        spritesheet = pygame.image.load(PACMAN_DEATH_PATH).convert_alpha()
-        sprites = []
-        
-        sprite_size = 15  # Установите размер спрайтов
-        sheet_width, sheet_height = 180, 15  # Установите размеры спрайтщита
-        
-        for y in range(0, sheet_height, sprite_size):
-            for x in range(0, sheet_width, sprite_size):
-                rect = pygame.Rect(x, y, sprite_size, sprite_size)
-                sprite = spritesheet.subsurface(rect)
-                sprite = pygame.transform.scale(sprite, (SPRITE_SIZE, SPRITE_SIZE))
-                sprites.append(sprite)
-        
-        return sprites
-        
+        return sprite_atlas.get_frames(PACMAN_DEATH_PATH, 15, 180, 15, self.headless)
 
     def find_spawn_point(self, maze, vertical_point):
         height = len(maze)
@@ -80,8 +57,9 @@ class PacMan(pygame.sprite.Sprite):
         # Если не найдено подходящее место, возвращаем центр maze
         return center_x, height
 
-    def count_food(self, maze):
-        return sum(row.count(0) for row in maze)
+    def count_food(self):
+        # Точки расставляются в пустые клетки уже после создания Пакмана
+        return self.grid.count(0)
 
     def update(self, dt):
         if self.is_dead:
@@ -145,7 +123,7 @@ class PacMan(pygame.sprite.Sprite):
 
             if self.frame == len(self.death_sprites) - 1:
                 self.death_animation_finished = True
-                pygame.mixer.Sound(RESTARTSOUND).play().set_volume(0.4)
+                sound_bank.play(RESTARTSOUND, 0.4)
 
     def can_move(self, x, y):
         # Проверка коллизий для всех четырех углов Pac-Man'а
@@ -189,17 +167,17 @@ class PacMan(pygame.sprite.Sprite):
         cell_x = int(self.x // GRID_SIZE)
         cell_y = int(self.y // GRID_SIZE)
         if self.maze[cell_y][cell_x] == 2:
-            self.maze[cell_y][cell_x] = 0
+            self.grid.set_cell(cell_x, cell_y, 0)
             self.points += 1
             if (self.evenAndOdd):
-                pygame.mixer.Sound(EAT_DOT_1).play().set_volume(0.1)
+                sound_bank.play(EAT_DOT_1, 0.1)
                 self.evenAndOdd = False
             else:
-                pygame.mixer.Sound(EAT_DOT_0).play().set_volume(0.1)
+                sound_bank.play(EAT_DOT_0, 0.1)
                 self.evenAndOdd = True
 
     def draw(self, screen):
-        screen.blit(self.current_sprite, (int(self.x - SPRITE_SIZE / 2), int(self.y - SPRITE_SIZE / 2)))
+        return screen.blit(self.current_sprite, (int(self.x - SPRITE_SIZE / 2), int(self.y - SPRITE_SIZE / 2)))
 
     def die(self):
         self.is_dead = True
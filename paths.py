@@ -0,0 +1,62 @@
+from itertools import islice
+from typing import Callable, Iterator, List, Optional, Tuple
+
+
+class Path:
+    """Путь из готового списка клеток с курсором: следующая клетка берется за O(1).
+
+    Список не копируется: PathRepairer отдает курсор прямо по своему пути, начиная
+    с cursor=1 (после клетки привидения). Список после этого не должен меняться.
+    """
+
+    __slots__ = ('cells', 'cursor')
+
+    def __init__(self, cells=(), cursor: int = 0):
+        self.cells: List[Tuple[int, int]] = cells if isinstance(cells, list) else list(cells)
+        self.cursor = cursor
+
+    def __bool__(self) -> bool:
+        return self.cursor < len(self.cells)
+
+    def __len__(self) -> int:
+        return len(self.cells) - self.cursor
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return islice(self.cells, self.cursor, None)
+
+    def pop_next(self) -> Tuple[int, int]:
+        cell = self.cells[self.cursor]
+        self.cursor += 1
+        return cell
+
+
+class LazyPath:
+    """Путь, который разворачивается по одной клетке из функции следующего шага.
+
+    next_step(cell) возвращает следующую клетку или None в конце пути (например,
+    NavigationTable.next_step или карта дерева ReverseTree). Список клеток не
+    строится, поэтому путь, брошенный на середине при перепланировании, ничего
+    не стоит и не держит память. При INCREMENTAL_REPLANNING погоня за Пакманом идет
+    через PathRepairer, которому нужен весь путь с номерами клеток, поэтому там
+    используется Path; лениво разворачиваются пути блуждания и погоня без починки.
+    """
+
+    __slots__ = ('next_step', 'upcoming')
+
+    def __init__(self, next_step: Callable[[Tuple[int, int]], Optional[Tuple[int, int]]], start: Tuple[int, int]):
+        self.next_step = next_step
+        self.upcoming = next_step(start)
+
+    def __bool__(self) -> bool:
+        return self.upcoming is not None
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        cell = self.upcoming
+        while cell is not None:
+            yield cell
+            cell = self.next_step(cell)
+
+    def pop_next(self) -> Tuple[int, int]:
+        cell = self.upcoming
+        self.upcoming = self.next_step(cell)
+        return cell
@@ -0,0 +1,237 @@
+from collections import deque, OrderedDict
+from typing import Dict, List, Tuple
+
+from algorithms import SHORTEST_PATHFINDERS, expand_reverse_tree, follow_next_steps
+from grid import Grid
+from paths import Path
+
+
+# Методы Ghost, которые всегда дают кратчайший путь: поиски из SHORTEST_PATHFINDERS,
+# обратное дерево 'batched' и граф развилок 'hierarchical'
+SHORTEST_METHODS = frozenset(SHORTEST_PATHFINDERS) | {'batched', 'hierarchical'}
+
+
+class ReverseTree:
+    """Обратный BFS от одной цели, который можно продолжать по мере надобности"""
+
+    def __init__(self, grid: Grid, goal: Tuple[int, int]):
+        self.grid = grid
+        self.goal = goal
+        self.next_step: Dict[Tuple[int, int], Tuple[int, int]] = {goal: None}
+        self.queue = deque([goal])
+        self.expanded = 0
+
+    def reach(self, starts) -> None:
+        """Продолжает поиск, пока все starts не окажутся в дереве (или поле не кончится)"""
+        remaining = {start for start in starts if start not in self.next_step}
+        if remaining:
+            self.expanded += expand_reverse_tree(self.grid, self.next_step, self.queue, remaining)[0]
+
+    def path(self, start: Tuple[int, int]) -> List[Tuple[int, int]]:
+        self.reach((start,))
+        return follow_next_steps(self.next_step, start)
+
+
+class SharedPathPlanner:
+    """Общий планировщик для привидений с pathfinding_method='batched'.
+
+    Все привидения, которые идут к одной цели, используют одно обратное дерево поиска
+    от этой цели, поэтому стоимость планирования почти не растет с числом привидений.
+    Деревья сбрасываются при изменении ревизии Grid.
+    """
+
+    def __init__(self, grid: Grid, max_trees: int = 8):
+        self.grid = grid
+        self.max_trees = max_trees
+        self.revision = grid.revision
+        self.trees: "OrderedDict[Tuple[int, int], ReverseTree]" = OrderedDict()
+        self.searches = 0  # Сколько раз строилось новое дерево
+        self.reused = 0    # Сколько запросов обслужено уже существующим деревом
+
+    def tree(self, goal: Tuple[int, int]) -> ReverseTree:
+        if self.grid.revision != self.revision:
+            self.trees.clear()
+            self.revision = self.grid.revision
+
+        tree = self.trees.get(goal)
+        if tree is None:
+            tree = ReverseTree(self.grid, goal)
+            self.trees[goal] = tree
+            self.searches += 1
+            if len(self.trees) > self.max_trees:
+                self.trees.popitem(last=False)
+        else:
+            self.trees.move_to_end(goal)
+            self.reused += 1
+        return tree
+
+    def path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
+        return self.tree(goal).path(start)
+
+    def plan(self, starts, goal: Tuple[int, int]) -> Dict[Tuple[int, int], List[Tuple[int, int]]]:
+        """Пути сразу для всех стартов к общей цели за один обратный поиск"""
+        tree = self.tree(goal)
+        tree.reach(starts)
+        return {start: follow_next_steps(tree.next_step, start) for start in starts}
+
+
+class PathRepairer:
+    """Повторное использование и починка прошлого пути привидения вместо полного поиска.
+
+    Если цель не изменилась, отдается остаток старого пути от текущей клетки.
+    Для кратчайших методов (SHORTEST_METHODS) путь еще и чинится: если цель
+    сдвинулась на клетку, которая уже лежит на пути дальше привидения, путь
+    обрезается; если цель ушла недалеко (не больше max_repair_steps по Манхэттену),
+    к старому пути достраивается короткий кусок от старой цели к новой. У greedy и
+    dfs обрезанный или достроенный путь не совпал бы с их поиском из текущей
+    клетки, поэтому для них при новой цели всегда выполняется полный поиск. Он же
+    выполняется после изменения стен и после max_repairs достроек подряд (чтобы
+    путь не накапливал лишние шаги).
+    """
+
+    def __init__(self, grid: Grid, max_repair_steps: int = 3, max_repairs: int = 8):
+        self.grid = grid
+        self.max_repair_steps = max_repair_steps
+        self.max_repairs = max_repairs
+        self.repairs_in_row = 0
+        self.path: List[Tuple[int, int]] = []  # Вместе с клеткой, откуда путь строился
+        self.index: Dict[Tuple[int, int], int] = {}
+        self.goal = None
+        self.revision = None
+        self.reused = 0
+        self.repaired = 0
+        self.recomputed = 0
+
+    def store(self, path: List[Tuple[int, int]], goal: Tuple[int, int]) -> Path:
+        # Убираем петли, которые могли появиться при достройке пути
+        result = []
+        positions: Dict[Tuple[int, int], int] = {}
+        for cell in path:
+            if cell in positions:
+                for removed in result[positions[cell] + 1:]:
+                    del positions[removed]
+                del result[positions[cell] + 1:]
+            else:
+                positions[cell] = len(result)
+                result.append(cell)
+        self.path = result
+        self.index = positions
+        self.goal = goal
+        self.revision = self.grid.revision
+        return Path(result, 1)  # Курсор по сохраненному пути, без копирования хвоста
+
+    def plan(self, method: str, start: Tuple[int, int], goal: Tuple[int, int], search) -> Path:
+        """search(start, goal) - полный поиск методом method; курсор пути стоит после стартовой клетки"""
+        if self.goal is not None and self.revision == self.grid.revision and start in self.index:
+            position = self.index[start]
+            if goal == self.goal:
+                self.reused += 1
+                return self.store(self.path[position:], goal)
+
+            if method in SHORTEST_METHODS:  # greedy и dfs при новой цели ищут заново
+                goal_position = self.index.get(goal)
+                if goal_position is not None and goal_position > position:
+                    # Часть кратчайшего пути - тоже кратчайший путь
+                    self.repaired += 1
+                    return self.store(self.path[position:goal_position + 1], goal)
+
+                distance = abs(goal[0] - self.goal[0]) + abs(goal[1] - self.goal[1])
+                if distance <= self.max_repair_steps and self.repairs_in_row < self.max_repairs:
+                    leg = search(self.goal, goal)
+                    if leg and len(leg) <= 2 * self.max_repair_steps:
+                        self.repaired += 1
+                        self.repairs_in_row += 1
+                        return self.store(self.path[position:] + leg, goal)
+
+        self.recomputed += 1
+        self.repairs_in_row = 0
+        path = search(start, goal)
+        if not path:
+            self.goal = None
+            return Path()
+        return self.store([start] + path, goal)
+
+
+class PathCache:
+    """Ограниченный LRU-кэш путей перед поисками из algorithms.py.
+
+    Ключ - (метод, старт, цель) при текущей ревизии Grid; при изменении стен кэш
+    очищается целиком. Для кратчайших методов (SHORTEST_METHODS), если точного пути
+    нет, но один из сохраненных путей того же метода к той же цели проходит через
+    старт, отдается его хвост: хвост кратчайшего пути тоже кратчайший. У greedy и dfs
+    хвост не совпал бы с результатом поиска из старта, поэтому для них - только точные ключи.
+    """
+
+    def __init__(self, grid: Grid, max_entries: int = 256):
+        self.grid = grid
+        self.max_entries = max_entries
+        self.revision = grid.revision
+        # (метод, старт, цель) -> (клетки от старта до цели включительно, номера клеток)
+        self.entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        # (метод, цель) -> клетка -> старты всех путей через нее (dict как упорядоченное множество)
+        self.through: Dict[tuple, Dict[Tuple[int, int], Dict[Tuple[int, int], None]]] = {}
+        self.hits = 0
+        self.suffix_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def clear(self):
+        self.entries.clear()
+        self.through.clear()
+
+    def get(self, method: str, start: Tuple[int, int], goal: Tuple[int, int], search) -> List[Tuple[int, int]]:
+        """Путь из кэша или search() (путь в формате метода), который затем сохраняется"""
+        if self.grid.revision != self.revision:
+            self.clear()
+            self.revision = self.grid.revision
+            self.invalidations += 1
+
+        key = (method, start, goal)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return list(entry[0][1:])
+
+        origins = self.through.get((method, goal), {}).get(start)
+        if origins:
+            origin_key = (method, next(reversed(origins)), goal)  # Самый свежий из путей через старт
+            self.entries.move_to_end(origin_key)
+            self.suffix_hits += 1
+            cells, positions = self.entries[origin_key]
+            return list(cells[positions[start] + 1:])
+
+        self.misses += 1
+        path = search()
+        if path or start == goal:
+            self.store(key, (start,) + tuple(path))
+        return path
+
+    def store(self, key: tuple, cells: tuple):
+        method, start, goal = key
+        positions = {cell: i for i, cell in enumerate(cells)}
+        self.entries[key] = (cells, positions)
+        if method in SHORTEST_METHODS:
+            through = self.through.setdefault((method, goal), {})
+            for cell in cells[:-1]:
+                through.setdefault(cell, {})[start] = None
+
+        if len(self.entries) > self.max_entries:
+            (method, old_start, old_goal), (old_cells, _) = self.entries.popitem(last=False)
+            self.evictions += 1
+            old_through = self.through.get((method, old_goal))
+            if old_through is not None:
+                # Снимаем только вытесненный путь: клетка остается за другими путями через нее
+                for cell in old_cells[:-1]:
+                    origins = old_through.get(cell)
+                    if origins is not None:
+                        origins.pop(old_start, None)
+                        if not origins:
+                            del old_through[cell]
+                if not old_through:
+                    del self.through[(method, old_goal)]
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'suffix_hits': self.suffix_hits, 'misses': self.misses,
+                'evictions': self.evictions, 'invalidations': self.invalidations, 'entries': len(self.entries)}
@@ -0,0 +1,153 @@
+import atexit
+import json
+import time
+from collections import deque
+
+import pygame
+from constants import *
+from hud import text_cache
+
+
+class _Phase:
+    """Контекстный менеджер одной фазы кадра; создается один раз на имя"""
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, time.perf_counter() - self.started, self.started)
+        return False
+
+
+class FrameProfiler:
+    """Замеры времени по фазам кадра со скользящими перцентилями.
+
+    Фазы оборачиваются в `with profiler.phase('name'):`. Для каждой фазы хранятся
+    последние window замеров, по ним считаются p50/p95/p99. Все замеры также
+    пишутся в трассу (не больше max_events последних), которую можно сохранить
+    в формате Chrome Trace (chrome://tracing, Perfetto).
+    """
+
+    def __init__(self, window=300, max_events=200000):
+        self.window = window
+        self.samples = {}
+        self.phases = {}
+        self.events = deque(maxlen=max_events)
+        self.origin = time.perf_counter()
+        self.frame_started = None
+        self.trace_path = None
+        self.overlay_visible = False
+        self.overlay_surface = None
+        self.overlay_updated = 0.0
+
+    def phase(self, name):
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = _Phase(self, name)
+            self.phases[name] = phase
+        return phase
+
+    def add(self, name, duration, started=None):
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = deque(maxlen=self.window)
+            self.samples[name] = samples
+        samples.append(duration)
+        if started is None:
+            started = time.perf_counter() - duration
+        self.events.append((name, started, duration))
+
+    def end_frame(self):
+        """Отмечает границу кадра: время между вызовами записывается как фаза 'frame'"""
+        now = time.perf_counter()
+        if self.frame_started is not None:
+            self.add('frame', now - self.frame_started, self.frame_started)
+        self.frame_started = now
+
+    def percentiles(self, name):
+        samples = sorted(self.samples.get(name, ()))
+        if not samples:
+            return 0.0, 0.0, 0.0
+        last = len(samples) - 1
+        return tuple(samples[round(last * q)] for q in (0.5, 0.95, 0.99))
+
+    def summary(self):
+        return {name: dict(zip(('p50', 'p95', 'p99'), self.percentiles(name))) for name in self.samples}
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        self.overlay_surface = None
+
+    def draw(self, screen):
+        """Рисует оверлей с перцентилями (в мс); возвращает измененный прямоугольник"""
+        if not self.overlay_visible:
+            return pygame.Rect(0, 0, 0, 0)
+
+        # Текст меняется каждый кадр, поэтому перерисовываем его не чаще двух раз в секунду
+        now = time.perf_counter()
+        if self.overlay_surface is None or now - self.overlay_updated > 0.5:
+            self.overlay_updated = now
+            size = int(10 * SCALE_FACTOR)
+            lines = [text_cache.font(size).render("phase      p50    p95    p99 ms", True, YELLOW)]
+            for name in sorted(self.samples):
+                p50, p95, p99 = self.percentiles(name)
+                text = f"{name:<9}{p50 * 1000:6.2f} {p95 * 1000:6.2f} {p99 * 1000:6.2f}"
+                lines.append(text_cache.font(size).render(text, True, WHITE))
+            width = max(line.get_width() for line in lines) + 8
+            height = sum(line.get_height() for line in lines) + 8
+            self.overlay_surface = pygame.Surface((width, height))
+            self.overlay_surface.fill(BLACK)
+            y = 4
+            for line in lines:
+                self.overlay_surface.blit(line, (4, y))
+                y += line.get_height()
+
+        return screen.blit(self.overlay_surface, (0, 0))
+
+    def enable_trace(self, path):
+        """Сохранить трассу в path при выходе из программы"""
+        if self.trace_path is None:
+            atexit.register(self.dump_at_exit)
+        self.trace_path = path
+
+    def dump_at_exit(self):
+        if self.trace_path:
+            self.dump(self.trace_path)
+
+    def dump(self, path):
+        events = [{'name': name, 'ph': 'X', 'pid': 0, 'tid': 0,
+                   'ts': (started - self.origin) * 1e6, 'dur': duration * 1e6}
+                  for name, started, duration in self.events]
+        with open(path, 'w') as file:
+            json.dump({'traceEvents': events, 'summary': self.summary()}, file)
+
+
+class NullProfiler:
+    """Профилировщик-заглушка: фазы ничего не замеряют"""
+
+    def __init__(self):
+        self._phase = _NullPhase()
+
+    def phase(self, name):
+        return self._phase
+
+    def add(self, name, duration, started=None):
+        pass
+
+
+class _NullPhase:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+null_profiler = NullProfiler()
+frame_profiler = FrameProfiler()
@@ -0,0 +1,88 @@
+import pygame
+from constants import *
+from profiler import null_profiler
+
+
+class DirtyRectRenderer:
+    """Отрисовка с кэшированным полем и обновлением только измененных областей.
+
+    Стены рисуются один раз в background, точки - в board (его копию). Каждый кадр
+    стираются старые прямоугольники спрайтов, съеденные точки и HUD, и на экран
+    отправляются только они через pygame.display.update(rects).
+    """
+
+    def __init__(self, screen, grid, profiler=null_profiler):
+        self.screen = screen
+        self.profiler = profiler
+        self.grid = grid
+        grid.changed_cells = []  # Grid начинает записывать измененные клетки для нас
+
+        self.background = pygame.Surface(screen.get_size())
+        self.background.fill(BLACK)
+        for y, row in enumerate(grid.maze):
+            for x, cell in enumerate(row):
+                if cell == 1:
+                    pygame.draw.rect(self.background, BLUE, (int(x * GRID_SIZE), int(y * GRID_SIZE), GRID_SIZE, GRID_SIZE))
+
+        self.board = self.background.copy()
+        for y, row in enumerate(grid.maze):
+            for x, cell in enumerate(row):
+                if cell == 2:
+                    self.draw_dot(x, y)
+
+        # Все, что ниже лабиринта, отдаем под HUD
+        maze_height = grid.height * GRID_SIZE
+        width, height = screen.get_size()
+        self.hud_rect = pygame.Rect(0, maze_height, width, max(height - maze_height, 0))
+        self.hud_state = None
+        self.sprite_rects = []
+        self.needs_full_redraw = True
+
+    def draw_dot(self, x, y):
+        pygame.draw.circle(self.board, WHITE, (int(x * GRID_SIZE + GRID_SIZE // 2), int(y * GRID_SIZE + GRID_SIZE // 2)), int(3 * SCALE_FACTOR))
+
+    def refresh_cell(self, x, y):
+        cell_rect = pygame.Rect(int(x * GRID_SIZE), int(y * GRID_SIZE), GRID_SIZE, GRID_SIZE)
+        self.board.blit(self.background, cell_rect, cell_rect)
+        if self.grid.maze[y][x] == 1:
+            pygame.draw.rect(self.board, BLUE, cell_rect)
+        elif self.grid.maze[y][x] == 2:
+            self.draw_dot(x, y)
+        return cell_rect
+
+    def invalidate(self):
+        """Следующий кадр будет нарисован целиком (например, после экрана с таймером)"""
+        self.needs_full_redraw = True
+
+    def draw_frame(self, sprites, hud_state, draw_hud):
+        """Рисует кадр. draw_hud(screen) вызывается, только когда меняется hud_state"""
+        dirty = []
+
+        for x, y in self.grid.changed_cells:
+            dirty.append(self.refresh_cell(x, y))
+        self.grid.changed_cells.clear()
+
+        if self.needs_full_redraw:
+            self.screen.blit(self.board, (0, 0))
+        else:
+            for rect in dirty:
+                self.screen.blit(self.board, rect, rect)
+            for rect in self.sprite_rects:
+                self.screen.blit(self.board, rect, rect)
+            dirty.extend(self.sprite_rects)
+
+        if self.needs_full_redraw or hud_state != self.hud_state:
+            self.screen.blit(self.board, self.hud_rect, self.hud_rect)
+            draw_hud(self.screen)
+            self.hud_state = hud_state
+            dirty.append(self.hud_rect)
+
+        self.sprite_rects = [sprite.draw(self.screen) for sprite in sprites]
+        dirty.extend(self.sprite_rects)
+
+        with self.profiler.phase('flip'):
+            if self.needs_full_redraw:
+                pygame.display.flip()
+                self.needs_full_redraw = False
+            else:
+                pygame.display.update(dirty)
@@ -1,10 +1,12 @@
 import time
 import pygame
 import sys
-from maze import generate_maze
 from constants import *
-from pacman import PacMan
-from ghost import Ghost
+from simulation import Simulation
+from renderer import DirtyRectRenderer
+from hud import text_cache
+from audio import sound_bank
+from profiler import frame_profiler
 
 def draw_maze(screen, maze):
     for y, row in enumerate(maze):
@@ -15,8 +17,7 @@ def draw_maze(screen, maze):
                 pygame.draw.circle(screen, WHITE, (int(x * GRID_SIZE + GRID_SIZE // 2), int(y * GRID_SIZE + GRID_SIZE // 2)), int(3 * SCALE_FACTOR))
 
 def draw_points(screen, points):
-    font = pygame.font.Font(FONT, int(36 * SCALE_FACTOR))
-    points_text = font.render(f"Points: {points}", True, WHITE)
+    points_text = text_cache.render(f"Points: {points}", int(36 * SCALE_FACTOR))
 
     text_rect = points_text.get_rect()
 
@@ -28,17 +29,17 @@ def draw_points(screen, points):
 
 def game_over(screen, won):
     # Выбор шрифта и цвета текста
-    font_large = pygame.font.Font(FONT, int(50 * SCALE_FACTOR))  # Шрифт для основного сообщения
-    font_small = pygame.font.Font(FONT, int(20 * SCALE_FACTOR))  # Шрифт для сообщения о выходе
+    large_size = int(50 * SCALE_FACTOR)  # Шрифт для основного сообщения
+    small_size = int(20 * SCALE_FACTOR)  # Шрифт для сообщения о выходе
     
     if won:
         # Если игра выиграна
-        game_over_text = font_large.render("You Win!", True, WHITE)
+        game_over_text = text_cache.render("You Win!", large_size)
     else:
         # Если игра проиграна
-        game_over_text = font_large.render("Game Over", True, WHITE)
+        game_over_text = text_cache.render("Game Over", large_size)
     
-    exit_text = font_small.render("Press SPACE to exit", True, WHITE)
+    exit_text = text_cache.render("Press SPACE to exit", small_size)
     
     # Получаем размеры текста
     game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
@@ -64,15 +65,14 @@ def game_over(screen, won):
 
 def start_game_timer(pacman, screen, time, maze):
     def draw_timer(screen, time_left):
-        font = pygame.font.Font(FONT, int(72 * SCALE_FACTOR))  # Большой шрифт для таймера
-        timer_text = font.render(str(time_left), True, WHITE)
+        timer_text = text_cache.render(str(time_left), int(72 * SCALE_FACTOR))  # Большой шрифт для таймера
         text_rect = timer_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))  # Центрируем текст
         screen.blit(timer_text, text_rect)
         
     # Таймер перед началом игры
     countdown = time  # 5 секунд отсчета
     countdown_start_time = pygame.time.get_ticks()
-    pygame.mixer.Sound(STARTSOUND).play().set_volume(0.2)
+    sound_bank.play(STARTSOUND, 0.2)
 
     # Основной игровой цикл с обратным отсчётом и заморозкой игры
     pacman.set_direction(PACMAN_SPEED, 0)
@@ -108,112 +108,88 @@ def draw_lives(screen, lives):
 
 def main():
     pygame.init()
+    text_cache.clear()
+    sound_bank.load()
     pygame.display.set_caption("pacman by aywski")
     pygame.display.set_icon(pygame.image.load("sprites/pacman.ico"))
-    maze = generate_maze(27, 29, diff=MAZE_DIFFICULTY)
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     clock = pygame.time.Clock()
-    pacman = PacMan(maze)
-    ghost = Ghost(maze, 60, CLYDE, pathfinding_method='a_star')
-    ghost2 = Ghost(maze, 60, PINKY, pathfinding_method='greedy')
-    # ghost3 = Ghost(maze, 60, INKY)
-    # ghost4 = Ghost(maze, 60, BLINKY)
 
+    profiler = frame_profiler
+    if PROFILE_TRACE_PATH:
+        profiler.enable_trace(PROFILE_TRACE_PATH)
 
-    deathSound = pygame.mixer.Sound(DEATHSOUND)
-    deathSound.set_volume(0.2)
+    # Вся игровая логика живет в Simulation, здесь только ввод и отрисовка
+    simulation = Simulation(seed=MAZE_SEED, headless=False, profiler=profiler)
+    if simulation.navigation is not None:
+        print(simulation.navigation.report())
+    maze = simulation.maze
+    pacman = simulation.pacman
+    ghosts = simulation.ghost_manager  # Ростер задается GHOST_ROSTER и GHOST_COUNT
 
-    # Размещение точек
-    for y, row in enumerate(maze):
-        for x, cell in enumerate(row):
-            if cell == 0:
-                maze[y][x] = 2
+    # Фон со стенами и точками рисуется один раз, дальше обновляются только изменения
+    renderer = DirtyRectRenderer(screen, simulation.grid, profiler) if DIRTY_RECT_RENDERING else None
 
-    # Основной игровой цикл после завершения отсчёта
-    soundPlayed = False
+    def draw_hud(surface):
+        with profiler.phase('hud'):
+            draw_points(surface, pacman.points)
+            draw_lives(surface, pacman.lives)  # Отображаем оставшиеся жизни
 
     # start_game_timer(pacman, screen, 3, maze)
 
-    while True:
-        dt = clock.tick(FPS) / 1000
+    # Реальное время копится и расходуется шагами фиксированной длины
+    accumulator = 0.0
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_LEFT:
-                    pacman.set_direction(-PACMAN_SPEED, 0)
-                elif event.key == pygame.K_RIGHT:
-                    pacman.set_direction(PACMAN_SPEED, 0)
-                elif event.key == pygame.K_UP:
-                    pacman.set_direction(0, -PACMAN_SPEED)
-                elif event.key == pygame.K_DOWN:
-                    pacman.set_direction(0, PACMAN_SPEED)
-                elif event.key == pygame.K_r:
-                    main()
-                    
-        if pacman.is_dead:
-            if not soundPlayed:
-                deathSound.play()
-                soundPlayed = True
-            pacman.update(dt)
-            ghost.update(dt, pacman)
-            ghost2.update(dt, pacman)
-            
-            screen.fill(BLACK)
-            draw_maze(screen, maze)
-            pacman.draw(screen)
-            ghost.draw(screen)
-            ghost2.draw(screen)
-
-            draw_points(screen, pacman.points)
-            draw_lives(screen, pacman.lives)  # Отображаем оставшиеся жизни
-            pygame.display.flip()
-
-            if pacman.death_animation_finished:
-                deathSound.stop()
-                if pacman.lives < 1:
-                    game_over(screen, False)
-                else:
-                    pacman.reset_after_death()
-                    ghost.reset_after_death()
-                    ghost2.reset_after_death()
-                    soundPlayed = False
+    while True:
+        accumulator += clock.tick(FPS) / 1000
+        profiler.end_frame()
 
+        with profiler.phase('events'):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_LEFT:
+                        simulation.set_direction(-PACMAN_SPEED, 0)
+                    elif event.key == pygame.K_RIGHT:
+                        simulation.set_direction(PACMAN_SPEED, 0)
+                    elif event.key == pygame.K_UP:
+                        simulation.set_direction(0, -PACMAN_SPEED)
+                    elif event.key == pygame.K_DOWN:
+                        simulation.set_direction(0, PACMAN_SPEED)
+                    elif event.key == pygame.K_F3:  # Оверлей с временем фаз кадра
+                        profiler.toggle_overlay()
+                        if renderer is not None:
+                            renderer.invalidate()
+                    elif event.key == pygame.K_r:
+                        main()
+
+        # Не догоняем больше нескольких шагов, если кадр сильно задержался
+        accumulator = min(accumulator, simulation.dt * MAX_STEPS_PER_FRAME)
+        with profiler.phase('simulation'):
+            while accumulator >= simulation.dt:
+                simulation.step()
+                accumulator -= simulation.dt
+
+        if simulation.finished:
+            game_over(screen, simulation.won)
+
+        if renderer is not None:
+            with profiler.phase('render'):
+                renderer.draw_frame([pacman, *ghosts, profiler], (pacman.points, pacman.lives), draw_hud)
         else:
-            pacman.update(dt)
-            ghost.update(dt, pacman)
-            ghost2.update(dt, pacman)
-
-
-            # Проверка на касание Пакмана и привидения
-            if pygame.sprite.collide_circle(pacman, ghost):
-                pacman.die()
-                ghost.die()
-                ghost2.die()
-                
-                pacman.lives -= 1
-
-            if pygame.sprite.collide_circle(pacman, ghost2):
-                pacman.die()
-                ghost.die()
-                ghost2.die()
-                
-                pacman.lives -= 1
-
-            if (pacman.points == pacman.total_dot):
-                game_over(screen, True)
-
-        screen.fill(BLACK)
-        draw_maze(screen, maze)
-        pacman.draw(screen)
-        ghost.draw(screen)
-        ghost2.draw(screen)
-
-        draw_points(screen, pacman.points)
-        draw_lives(screen, pacman.lives)  # Отображаем оставшиеся жизни
-        pygame.display.flip()
+            with profiler.phase('maze'):
+                screen.fill(BLACK)
+                draw_maze(screen, maze)
+            with profiler.phase('sprites'):
+                pacman.draw(screen)
+                ghosts.draw(screen)
+
+            draw_hud(screen)
+            profiler.draw(screen)
+            with profiler.phase('flip'):
+                pygame.display.flip()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
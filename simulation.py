@@ -0,0 +1,167 @@
+import random
+
+from constants import *
+from audio import sound_bank
+from collisions import EntityRegistry
+from ghost_manager import GhostManager, make_roster
+from grid import Grid
+from maze import generate_maze
+from navigation import NavigationTable
+from pacman import PacMan
+from planner import SharedPathPlanner, PathCache
+from profiler import null_profiler
+from visibility import VisibilityMap
+
+DIRECTIONS = ((PACMAN_SPEED, 0), (-PACMAN_SPEED, 0), (0, PACMAN_SPEED), (0, -PACMAN_SPEED))
+
+
+class RandomController:
+    """Простой автопилот для Пакмана: меняет направление, когда упирается в стену"""
+
+    def __init__(self, rng, turn_chance=0.02):
+        self.rng = rng
+        self.turn_chance = turn_chance
+        self.last_position = None
+
+    def __call__(self, simulation):
+        pacman = simulation.pacman
+        position = (pacman.x, pacman.y)
+        stuck = position == self.last_position
+        self.last_position = position
+        if stuck or self.rng.random() < self.turn_chance:
+            return self.rng.choice(DIRECTIONS)
+        return None
+
+
+class Simulation:
+    """Игровая логика без окна и звука, шагающая с фиксированным dt.
+
+    Содержит лабиринт, Пакмана, привидений, столкновения и счет. Окно pygame
+    только рисует состояние и передает нажатия клавиш через set_direction, а в
+    режиме headless симуляцию можно гонять тысячи раз подряд для оценки ИИ.
+    controller(simulation) вызывается каждый шаг и может вернуть новое
+    направление Пакмана (dx, dy) или None. ghosts - ростер привидений
+    (см. GHOST_ROSTER), по умолчанию make_roster().
+    """
+
+    def __init__(self, width=27, height=29, difficulty=MAZE_DIFFICULTY, seed=None, ghosts=None,
+                 headless=True, controller=None, dt=1 / FPS, use_navigation=USE_NAVIGATION_TABLE, profiler=null_profiler):
+        self.rng = random.Random(seed)
+        self.profiler = profiler
+        self.dt = dt
+        self.headless = headless
+        self.controller = controller
+
+        self.maze = generate_maze(width, height, diff=difficulty, seed=seed)
+        self.grid = Grid(self.maze, COMPACT_GRID)
+        self.planner = SharedPathPlanner(self.grid)
+        self.path_cache = PathCache(self.grid, PATH_CACHE_SIZE) if PATH_CACHE_SIZE else None
+        self.navigation = NavigationTable(self.grid) if use_navigation else None
+        self.visibility = VisibilityMap(self.grid)
+
+        if ghosts is None:
+            ghosts = make_roster()
+        self.pacman = PacMan(self.maze, self.grid, headless=headless)
+        self.ghost_manager = GhostManager(self.maze, ghosts, navigation=self.navigation, grid=self.grid,
+                                          planner=self.planner, visibility=self.visibility,
+                                          path_cache=self.path_cache, headless=headless, rng=self.rng)
+        self.ghosts = self.ghost_manager.ghosts
+        self.junctions = self.ghost_manager.junctions  # Граф развилок, если в ростере есть 'hierarchical'
+
+        self.entities = EntityRegistry()
+        self.entities.add(self.pacman, 'pacman')
+        for ghost in self.ghosts:
+            self.entities.add(ghost, 'ghost')
+
+        # Размещение точек
+        self.grid.fill_dots()
+
+        self.ticks = 0
+        self.deaths = 0
+        self.finished = False
+        self.won = False
+        self.death_sound_played = False
+
+    def set_direction(self, dx, dy):
+        self.pacman.set_direction(dx, dy)
+
+    def step(self):
+        if self.finished:
+            return
+
+        dt = self.dt
+        pacman = self.pacman
+
+        if self.controller is not None and not pacman.is_dead:
+            direction = self.controller(self)
+            if direction is not None:
+                pacman.set_direction(*direction)
+
+        profiler = self.profiler
+        with profiler.phase('pacman'):
+            pacman.update(dt)
+            self.entities.move(pacman)
+
+        planning_time = self.ghost_manager.planning_time
+        with profiler.phase('ghosts'):
+            self.ghost_manager.update(dt, pacman)
+            for ghost in self.ghosts:
+                self.entities.move(ghost)
+        # Поиск пути идет внутри Ghost.update, его долю берем из счетчиков привидений
+        profiler.add('pathfinding', self.ghost_manager.planning_time - planning_time)
+
+        if pacman.is_dead:
+            if not self.death_sound_played:
+                sound_bank.play(DEATHSOUND, 0.2)
+                self.death_sound_played = True
+
+            if pacman.death_animation_finished:
+                sound_bank.stop(DEATHSOUND)
+                if pacman.lives < 1:
+                    self.finished = True
+                else:
+                    pacman.reset_after_death()
+                    self.entities.move(pacman)
+                    self.ghost_manager.reset_after_death()
+                    for ghost in self.ghosts:
+                        self.entities.move(ghost)
+                    self.death_sound_played = False
+        else:
+            # Проверка на касание Пакмана и привидения: смотрим только соседние клетки
+            with profiler.phase('collisions'):
+                if self.entities.colliding(pacman, 'ghost'):
+                    pacman.die()
+                    self.ghost_manager.die()
+                    pacman.lives -= 1
+                    self.deaths += 1
+
+            if pacman.points == pacman.total_dot:
+                self.finished = True
+                self.won = True
+
+        self.ticks += 1
+
+    def run(self, max_ticks=FPS * 60 * 5):
+        """Гоняет симуляцию до конца игры или до max_ticks шагов"""
+        while not self.finished and self.ticks < max_ticks:
+            self.step()
+        return self.result()
+
+    def result(self):
+        reused, repaired, recomputed = self.ghost_manager.repair_stats()
+        return {
+            'score': self.pacman.points,
+            'ticks': self.ticks,
+            'deaths': self.deaths,
+            'won': self.won,
+            'finished': self.finished,
+            'ghosts': len(self.ghosts),
+            'planning_time': self.ghost_manager.planning_time,
+            'searches': self.ghost_manager.searches,
+            'paths_reused': reused,
+            'paths_repaired': repaired,
+            'paths_recomputed': recomputed,
+            'cache_hits': self.path_cache.hits + self.path_cache.suffix_hits if self.path_cache else 0,
+            'cache_misses': self.path_cache.misses if self.path_cache else 0,
+            'cache_evictions': self.path_cache.evictions if self.path_cache else 0,
+        }
@@ -0,0 +1,42 @@
+import pygame
+from constants import *
+
+
+class SpriteAtlas:
+    """Общий для всего процесса кэш кадров из спрайтщитов.
+
+    Каждый PNG загружается один раз, кадры нарезаются и масштабируются до
+    SPRITE_SIZE один раз, а все привидения с одним скином получают одни и те же
+    поверхности. Кадры возвращаются кортежем, чтобы их нельзя было случайно изменить.
+    """
+
+    def __init__(self):
+        self.frames = {}
+        self.loads = 0  # Сколько раз действительно читался файл
+
+    def get_frames(self, path, sprite_size, sheet_width, sheet_height, headless=False):
+        if headless:
+            # Без окна картинки не нужны, но число кадров важно для анимаций и таймингов
+            return (None,) * ((sheet_width // sprite_size) * (sheet_height // sprite_size))
+
+        key = (path, sprite_size, sheet_width, sheet_height, SPRITE_SIZE)
+        frames = self.frames.get(key)
+        if frames is None:
+            frames = self.load_frames(path, sprite_size, sheet_width, sheet_height)
+            self.frames[key] = frames
+        return frames
+
+    def load_frames(self, path, sprite_size, sheet_width, sheet_height):
+        spritesheet = pygame.image.load(path).convert_alpha()
+        self.loads += 1
+        sprites = []
+        for y in range(0, sheet_height, sprite_size):
+            for x in range(0, sheet_width, sprite_size):
+                rect = pygame.Rect(x, y, sprite_size, sprite_size)
+                sprite = spritesheet.subsurface(rect)
+                sprite = pygame.transform.scale(sprite, (SPRITE_SIZE, SPRITE_SIZE))
+                sprites.append(sprite)
+        return tuple(sprites)
+
+
+sprite_atlas = SpriteAtlas()
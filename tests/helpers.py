@@ -0,0 +1,72 @@
+"""Общие лабиринты, генераторы запросов и проверки путей для тестов"""
+import random
+
+from algorithms import PATHFINDERS, bfs
+from grid import Grid
+from maze import generate_maze
+
+MAZES = [(31, 'easy', 1), (31, 'medium', 2), (31, 'hard', 3), (30, 'medium', 4)]
+
+
+def open_room(size, seed):
+    """Комната со случайными препятствиями: длинные прямые для jps и двунаправленных поисков"""
+    rng = random.Random(seed)
+    maze = [[1 if x in (0, size - 1) or y in (0, size - 1) else 0 for x in range(size)] for y in range(size)]
+    for _ in range(size * size // 6):
+        maze[rng.randrange(1, size - 1)][rng.randrange(1, size - 1)] = 1
+    return maze
+
+
+def grids():
+    for size, difficulty, seed in MAZES:
+        yield Grid(generate_maze(size, size, difficulty, seed=seed))
+    yield Grid(open_room(24, 5))
+
+
+def corridor(length):
+    """Прямой коридор (1, 1) .. (length, 1) и тупиковое ответвление вниз из (3, 1) до (3, 3)"""
+    maze = [[1] * (length + 2), [1] + [0] * length + [1], [1] * (length + 2), [1] * (length + 2), [1] * (length + 2)]
+    maze[2][3] = maze[3][3] = 0
+    return Grid(maze)
+
+
+def random_pairs(grid, count, rng):
+    cells = grid.walkable_cells()
+    return [(rng.choice(cells), rng.choice(cells)) for _ in range(count)]
+
+
+def toggle_random_cell(grid, rng):
+    x, y = rng.randrange(1, grid.width - 1), rng.randrange(1, grid.height - 1)
+    grid.set_cell(x, y, 0 if grid.cell(x, y) == 1 else 1)
+
+
+def assert_valid_path(grid, start, goal, path):
+    """Путь без стартовой клетки, по соседним проходимым клеткам, с целью в конце"""
+    previous = start
+    for cell in path:
+        assert cell in grid.get_neighbors(previous), (previous, cell)
+        previous = cell
+    if path:
+        assert path[-1] == goal
+        assert start not in path
+
+
+def assert_matches_bfs(grid, start, goal, path, shortest=True):
+    expected = bfs(grid, start, goal)
+    assert_valid_path(grid, start, goal, path)
+    assert bool(path) == bool(expected), (start, goal)
+    if shortest:
+        assert len(path) == len(expected), (start, goal)
+
+
+class CountingSearch:
+    """search(start, goal) по методу из PATHFINDERS со счетчиком вызовов"""
+
+    def __init__(self, grid, method):
+        self.grid = grid
+        self.search = PATHFINDERS[method]
+        self.calls = 0
+
+    def __call__(self, start, goal):
+        self.calls += 1
+        return self.search(self.grid, start, goal)
@@ -0,0 +1,59 @@
+"""EntityRegistry против перебора всех привидений через pygame.sprite.collide_circle"""
+import random
+
+import pygame
+
+from collisions import EntityRegistry
+from constants import GRID_SIZE
+
+
+class Body(pygame.sprite.Sprite):
+    def __init__(self, x, y, radius):
+        super().__init__()
+        self.radius = radius
+        self.rect = pygame.Rect(0, 0, 2 * radius, 2 * radius)
+        self.rect.center = (x, y)
+
+
+def brute_force(pacman, ghosts):
+    return {ghost for ghost in ghosts if pygame.sprite.collide_circle(pacman, ghost)}
+
+
+def test_colliding_matches_collide_circle_loop():
+    rng = random.Random(1)
+    pacman = Body(10 * GRID_SIZE, 10 * GRID_SIZE, GRID_SIZE // 2)
+    ghosts = [Body(0, 0, rng.choice((GRID_SIZE // 2, GRID_SIZE // 3, GRID_SIZE))) for _ in range(60)]
+    registry = EntityRegistry()
+    registry.add(pacman, 'pacman')
+    for ghost in ghosts:
+        registry.add(ghost, 'ghost')
+
+    found = 0
+    for _ in range(300):
+        pacman.rect.center = (rng.randrange(6 * GRID_SIZE, 14 * GRID_SIZE), rng.randrange(6 * GRID_SIZE, 14 * GRID_SIZE))
+        registry.move(pacman)
+        for ghost in ghosts:
+            # Вокруг Пакмана, в том числе в диагональных клетках и на их границах
+            ghost.rect.center = (pacman.rect.centerx + rng.randrange(-2 * GRID_SIZE, 2 * GRID_SIZE + 1),
+                                 pacman.rect.centery + rng.randrange(-2 * GRID_SIZE, 2 * GRID_SIZE + 1))
+            registry.move(ghost)
+        expected = brute_force(pacman, ghosts)
+        assert set(registry.colliding(pacman, 'ghost')) == expected
+        assert len(registry.colliding(pacman, 'ghost')) == len(expected)
+        assert pacman not in registry.colliding(pacman)
+        found += len(expected)
+    assert found > 0
+
+
+def test_colliding_in_diagonal_cell():
+    pacman = Body(5 * GRID_SIZE + GRID_SIZE - 2, 5 * GRID_SIZE + GRID_SIZE - 2, GRID_SIZE // 2)
+    ghost = Body(6 * GRID_SIZE + 2, 6 * GRID_SIZE + 2, GRID_SIZE // 2)  # Соседняя клетка по диагонали
+    registry = EntityRegistry()
+    registry.add(pacman, 'pacman')
+    registry.add(ghost, 'ghost')
+    assert registry.cell_of(pacman) == (5, 5) and registry.cell_of(ghost) == (6, 6)
+    assert registry.colliding(pacman, 'ghost') == [ghost]
+    assert registry.colliding(ghost, 'pacman') == [pacman]
+
+    registry.remove(ghost)
+    assert registry.colliding(pacman, 'ghost') == []
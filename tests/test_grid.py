@@ -0,0 +1,99 @@
+"""Grid: запросы ко всему полю и индекс проходимых клеток против обхода лабиринта"""
+import random
+
+import pytest
+
+from grid import DOT, WALL, Grid
+from maze import generate_maze
+
+BACKENDS = [None, 'bytearray', 'numpy']
+
+
+def make_grid(compact, seed=1):
+    if compact == 'numpy':
+        pytest.importorskip('numpy')
+    grid = Grid(generate_maze(25, 25, 'medium', seed=seed), compact)
+    assert (grid.cells is None) == (compact is None)
+    assert grid.numpy == (compact == 'numpy')
+    return grid
+
+
+def flat_mask(mask):
+    if hasattr(mask, 'tolist'):  # bool-массив NumPy height x width
+        return bytes(int(value) for row in mask.tolist() for value in row)
+    return mask
+
+
+def assert_queries_match_scan(grid):
+    flat = [value for row in grid.maze for value in row]
+    for value in (0, WALL, DOT):
+        assert grid.count(value) == flat.count(value)
+    assert grid.dot_count() == flat.count(DOT)
+    assert flat_mask(grid.wall_mask()) == bytes(int(value == WALL) for value in flat)
+    assert flat_mask(grid.dot_mask()) == bytes(int(value == DOT) for value in flat)
+
+
+@pytest.mark.parametrize('compact', BACKENDS)
+def test_whole_grid_queries_follow_set_cell(compact):
+    rng = random.Random(compact)
+    grid = make_grid(compact)
+    maze = grid.maze
+    grid.fill_dots()
+    assert grid.maze is maze and grid.count(0) == 0
+    assert_queries_match_scan(grid)
+    for _ in range(300):
+        x, y = rng.randrange(1, grid.width - 1), rng.randrange(1, grid.height - 1)
+        grid.set_cell(x, y, rng.choice((0, WALL, DOT)))  # И стены, и съеденные/новые точки
+        assert_queries_match_scan(grid)
+    grid.fill_dots()
+    assert grid.count(0) == 0
+    assert_queries_match_scan(grid)
+
+
+def assert_index_matches_scan(grid):
+    cells = [(x, y) for y in range(grid.height) for x in range(grid.width) if grid.maze[y][x] != WALL]
+    assert sorted(grid.walkable, key=lambda cell: (cell[1], cell[0])) == cells
+    assert len(grid.walkable) == len(grid.walkable_index)
+    assert all(grid.walkable[i] == cell for cell, i in grid.walkable_index.items())
+    for y in range(grid.height):
+        assert grid.row_cells[y] == [x for x, cell_y in cells if cell_y == y]
+    return cells
+
+
+def test_walkable_index_and_radius_queries_follow_set_cell():
+    rng = random.Random(4)
+    grid = make_grid(None, seed=4)
+    for step in range(400):
+        x, y = rng.randrange(grid.width), rng.randrange(grid.height)  # Вместе с краями поля
+        grid.set_cell(x, y, rng.choice((0, WALL, WALL, DOT)))
+        if step % 20:
+            continue
+        cells = assert_index_matches_scan(grid)
+        assert grid.random_walkable(rng) in cells
+        for _ in range(10):
+            center = (rng.randrange(-2, grid.width + 2), rng.randrange(-2, grid.height + 2))
+            radius = rng.randrange(0, 9)
+            expected = [(cx, cy) for cx, cy in cells
+                        if (cx - center[0]) ** 2 + (cy - center[1]) ** 2 <= radius * radius]
+            assert grid.walkable_within(center, radius) == expected
+            picked = grid.random_walkable_within(rng, center, radius)
+            assert picked in expected if expected else picked is None
+
+
+def test_random_walkable_within_is_uniform():
+    grid = make_grid(None, seed=5)
+    rng = random.Random(5)
+    center = (grid.width // 2, grid.height // 2)
+    cells = grid.walkable_within(center, 4)
+    counts = dict.fromkeys(cells, 0)
+    for _ in range(200 * len(cells)):
+        counts[grid.random_walkable_within(rng, center, 4)] += 1
+    assert min(counts.values()) > 120 and max(counts.values()) < 280
+
+
+def test_empty_grid_has_no_random_cell():
+    grid = Grid([[1, 1], [1, 1]])
+    assert grid.random_walkable(random.Random(0)) is None
+    assert grid.random_walkable_within(random.Random(0), (0, 0), 3) is None
+    grid.set_cell(1, 1, 0)
+    assert grid.walkable_cells() == [(1, 1)] and grid.walkable_within((0, 0), 1) == []
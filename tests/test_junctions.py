@@ -0,0 +1,61 @@
+"""JunctionGraph ('hierarchical') против bfs, в том числе после локальных перестроек"""
+import random
+
+import pytest
+
+from grid import Grid
+from junctions import JunctionGraph
+from maze import generate_maze
+
+from tests.helpers import assert_matches_bfs, grids, random_pairs, toggle_random_cell
+
+
+def test_junction_graph_matches_bfs():
+    rng = random.Random(2)
+    for grid in grids():
+        graph = JunctionGraph(grid)
+        for start, goal in random_pairs(grid, 40, rng):
+            assert_matches_bfs(grid, start, goal, graph.path(start, goal))
+        graph.close()
+
+
+@pytest.mark.parametrize('difficulty', ['easy', 'medium', 'hard'])
+def test_junction_graph_after_set_cell(difficulty):
+    rng = random.Random(difficulty)
+    grid = Grid(generate_maze(31, 31, difficulty, seed=3))
+    graph = JunctionGraph(grid)
+    for _ in range(60):
+        toggle_random_cell(grid, rng)
+        for start, goal in random_pairs(grid, 4, rng):
+            assert_matches_bfs(grid, start, goal, graph.path(start, goal))
+
+    # Локальные перестройки дают те же развилки и те же длины коридоров, что и граф с нуля
+    # (в кольце без развилок узлом может стать другая клетка, поэтому сравниваются только развилки)
+    fresh = JunctionGraph(grid)
+    junctions = {node for node in fresh.nodes if len(grid.neighbors[node]) != 2}
+    assert {node for node in graph.nodes if len(grid.neighbors[node]) != 2} == junctions
+    assert sorted(len(cells) for _, _, cells in graph.edges.values()) == \
+        sorted(len(cells) for _, _, cells in fresh.edges.values())
+    assert set(graph.corridor) | graph.nodes == set(grid.neighbors)
+    fresh.close()
+
+    graph.close()
+    assert grid.listeners == []
+
+
+def test_junction_graph_ring_cut_off_by_set_cell():
+    # Кольцо вокруг стены, связанное с коридором через (3, 2); после стены в (4, 2)
+    # в кольце не остается развилок, и граф должен сделать узлом одну из его клеток
+    rows = ['#########',
+            '#...#####',
+            '#.#.....#',
+            '#...#####',
+            '#########']
+    grid = Grid([[1 if char == '#' else 0 for char in row] for row in rows])
+    graph = JunctionGraph(grid)
+    grid.set_cell(4, 2, 1)
+    assert set(graph.corridor) | graph.nodes == set(grid.neighbors)
+    for start in grid.walkable_cells():
+        for goal in grid.walkable_cells():
+            assert_matches_bfs(grid, start, goal, graph.path(start, goal))
+    graph.close()
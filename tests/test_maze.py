@@ -0,0 +1,51 @@
+"""generate_maze: воспроизводимость по seed, целая рамка и проходы во всех узлах"""
+import pytest
+
+from maze import generate_maze
+
+SIZES = [(27, 29), (30, 30), (28, 31), (31, 28), (5, 5), (6, 4)]
+
+
+@pytest.mark.parametrize('width, height', SIZES)
+@pytest.mark.parametrize('difficulty', ['easy', 'medium', 'hard'])
+def test_same_seed_gives_same_maze(width, height, difficulty):
+    maze = generate_maze(width, height, difficulty, seed=7)
+    assert generate_maze(width, height, difficulty, seed=7) == maze
+    assert len(maze) == height and all(len(row) == width for row in maze)
+    assert all(value in (0, 1) for row in maze for value in row)
+
+
+def test_different_seeds_give_different_mazes():
+    mazes = {tuple(map(tuple, generate_maze(27, 29, 'medium', seed=seed))) for seed in range(10)}
+    assert len(mazes) == 10
+
+
+@pytest.mark.parametrize('width, height', SIZES)
+@pytest.mark.parametrize('difficulty', ['easy', 'medium', 'hard'])
+def test_border_stays_wall(width, height, difficulty):
+    for seed in range(5):
+        maze = generate_maze(width, height, difficulty, seed=seed)
+        assert all(value == 1 for value in maze[0] + maze[-1])
+        assert all(row[0] == 1 and row[-1] == 1 for row in maze)
+
+
+@pytest.mark.parametrize('width, height', SIZES)
+def test_every_node_is_carved_and_connected(width, height):
+    # Узлы на нечетных координатах: поиск в глубину обходит их все, поэтому каждый узел -
+    # проход, достижимый из (1, 1); удаление стен связность не портит
+    maze = generate_maze(width, height, 'hard', seed=3)
+    nodes = {(x, y) for y in range(1, height - 1, 2) for x in range(1, width - 1, 2)}
+    assert all(maze[y][x] == 0 for x, y in nodes)
+    seen, stack = {(1, 1)}, [(1, 1)]
+    while stack:
+        x, y = stack.pop()
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if maze[ny][nx] == 0 and (nx, ny) not in seen:
+                seen.add((nx, ny))
+                stack.append((nx, ny))
+    assert nodes <= seen
+
+
+def test_large_maze_without_recursion_limit():
+    maze = generate_maze(401, 401, 'medium', seed=1)
+    assert maze[1][1] == 0 and maze[399][399] == 0
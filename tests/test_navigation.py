@@ -0,0 +1,74 @@
+"""NavigationTable против bfs, перестройка после изменения стен и оценка памяти"""
+import random
+
+from algorithms import bfs
+from grid import DOT, Grid
+from maze import generate_maze
+from navigation import NavigationTable
+
+from tests.helpers import assert_matches_bfs, grids, random_pairs, toggle_random_cell
+
+
+def assert_table_matches_bfs(table, grid, pairs):
+    for start, goal in pairs:
+        expected = bfs(grid, start, goal)
+        path = table.path(start, goal)
+        assert_matches_bfs(grid, start, goal, path)
+        if start == goal:
+            assert table.distance(start, goal) == 0 and table.next_step(start, goal) is None
+        elif expected:
+            assert table.distance(start, goal) == len(expected)
+            assert table.next_step(start, goal) == path[0]
+        else:
+            assert table.distance(start, goal) is None and table.next_step(start, goal) is None
+
+
+def test_navigation_table_matches_bfs():
+    rng = random.Random(1)
+    for grid in grids():
+        table = NavigationTable(grid)
+        assert_table_matches_bfs(table, grid, random_pairs(grid, 200, rng))
+
+
+def test_navigation_table_unreachable_cells():
+    grid = Grid([[1, 1, 1, 1, 1],
+                 [1, 0, 1, 0, 1],
+                 [1, 0, 1, 0, 1],
+                 [1, 1, 1, 1, 1]])
+    table = NavigationTable(grid)
+    cells = grid.walkable_cells()
+    assert_table_matches_bfs(table, grid, [(start, goal) for start in cells for goal in cells])
+    assert table.distance((1, 1), (0, 0)) is None  # Стена - не клетка таблицы
+
+
+def test_navigation_table_rebuilds_after_wall_change_only():
+    rng = random.Random(2)
+    grid = Grid(generate_maze(21, 21, 'medium', seed=2))
+    grid.fill_dots()
+    table = NavigationTable(grid)
+    assert not table.refresh(grid)
+
+    # Съеденная и вновь поставленная точка (2 <-> 0) не меняет проходимость: таблица та же
+    x, y = next(cell for cell in grid.walkable_cells() if grid.cell(*cell) == DOT)
+    grid.set_cell(x, y, 0)
+    grid.set_cell(x, y, DOT)
+    assert not table.is_stale(grid) and not table.refresh(grid)
+
+    for _ in range(10):
+        toggle_random_cell(grid, rng)
+        assert table.is_stale(grid)
+        assert table.refresh(grid)
+        assert not table.refresh(grid)
+        assert_table_matches_bfs(table, grid, random_pairs(grid, 40, rng))
+
+
+def test_estimate_memory_agrees_with_built_table():
+    rng = random.Random(3)
+    for size, difficulty in ((11, 'easy'), (21, 'medium'), (25, 'hard')):
+        grid = Grid(generate_maze(size, size, difficulty, seed=size))
+        table = NavigationTable(grid)
+        assert NavigationTable.estimate_memory(grid) == table.memory_bytes
+        for _ in range(5):
+            toggle_random_cell(grid, rng)
+        table.refresh(grid)
+        assert NavigationTable.estimate_memory(grid) == table.memory_bytes
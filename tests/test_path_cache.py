@@ -0,0 +1,72 @@
+"""PathCache против полного поиска: точные попадания, хвосты путей, вытеснение и сброс"""
+import random
+
+from algorithms import PATHFINDERS, a_star
+from grid import Grid
+from maze import generate_maze
+from planner import PathCache
+
+from tests.helpers import CountingSearch, assert_matches_bfs, corridor, toggle_random_cell
+
+
+def test_path_cache_returns_search_results():
+    rng = random.Random(1)
+    grid = Grid(generate_maze(31, 31, 'medium', seed=1))
+    cache = PathCache(grid, max_entries=16)
+    goals = [rng.choice(grid.walkable_cells()) for _ in range(3)]
+    for i in range(1500):
+        if i % 300 == 299:
+            toggle_random_cell(grid, rng)
+        method = rng.choice(['a_star', 'jps', 'greedy', 'dfs'])
+        start, goal = rng.choice(grid.walkable_cells()), rng.choice(goals)
+        if goal not in grid.neighbors:
+            continue
+        search = PATHFINDERS[method]
+        path = cache.get(method, start, goal, lambda: search(grid, start, goal))
+        if method in ('greedy', 'dfs'):
+            assert path == search(grid, start, goal)  # Только точные ключи, без хвостов чужих путей
+        else:
+            assert_matches_bfs(grid, start, goal, path)
+        assert len(cache.entries) <= 16
+    assert cache.hits + cache.suffix_hits > 0
+    assert cache.evictions > 0 and cache.invalidations > 0
+
+
+def test_path_cache_suffix_hits_only_for_shortest_methods():
+    grid = corridor(9)
+    cache = PathCache(grid)
+    for method in ('a_star', 'greedy'):
+        search = CountingSearch(grid, method)
+        cache.get(method, (1, 1), (9, 1), lambda: search((1, 1), (9, 1)))
+        path = cache.get(method, (4, 1), (9, 1), lambda: search((4, 1), (9, 1)))
+        assert path == [(5, 1), (6, 1), (7, 1), (8, 1), (9, 1)]
+        assert search.calls == (1 if method == 'a_star' else 2)
+    assert cache.suffix_hits == 1
+
+
+def test_path_cache_eviction_keeps_cells_of_other_entries():
+    grid = corridor(9)
+    goal = (9, 1)
+    cache = PathCache(grid, max_entries=2)
+    cache.get('a_star', (1, 1), goal, lambda: a_star(grid, (1, 1), goal))
+    cache.get('a_star', (3, 3), goal, lambda: a_star(grid, (3, 3), goal))  # Из ответвления: те же клетки 3..8
+    cache.get('a_star', (1, 1), goal, None)  # Точное попадание: путь из (1, 1) становится свежим
+    cache.get('a_star', (2, 1), (1, 1), lambda: a_star(grid, (2, 1), (1, 1)))  # Вытесняет путь из (3, 3)
+
+    search = CountingSearch(grid, 'a_star')
+    path = cache.get('a_star', (5, 1), goal, lambda: search((5, 1), goal))
+    assert path == [(6, 1), (7, 1), (8, 1), (9, 1)]
+    assert search.calls == 0
+
+
+def test_path_cache_invalidated_by_set_cell():
+    grid = Grid(generate_maze(21, 21, 'easy', seed=2))
+    cache = PathCache(grid)
+    start, goal = grid.walkable_cells()[0], grid.walkable_cells()[-1]
+    search = CountingSearch(grid, 'bfs')
+    cache.get('bfs', start, goal, lambda: search(start, goal))
+    cell = cache.get('bfs', start, goal, None)[0]
+    grid.set_cell(cell[0], cell[1], 1)
+    path = cache.get('bfs', start, goal, lambda: search(start, goal))
+    assert search.calls == 2
+    assert_matches_bfs(grid, start, goal, path)
@@ -0,0 +1,82 @@
+"""PathRepairer против полного поиска, в том числе внутри Ghost"""
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from algorithms import PATHFINDERS, bfs
+from constants import GRID_SIZE
+from ghost import Ghost
+from grid import Grid
+from maze import generate_maze
+from planner import PathRepairer
+
+from tests.helpers import CountingSearch, assert_valid_path, random_pairs, toggle_random_cell
+
+
+def test_path_repairer_follows_moving_goal():
+    rng = random.Random(3)
+    grid = Grid(generate_maze(41, 41, 'easy', seed=3))
+    repairer = PathRepairer(grid)
+    search = CountingSearch(grid, 'bfs')
+    start, goal = random_pairs(grid, 1, rng)[0]
+    for i in range(800):
+        if i % 200 == 199:
+            toggle_random_cell(grid, rng)
+            if start not in grid.neighbors or goal not in grid.neighbors:
+                start, goal = random_pairs(grid, 1, rng)[0]
+        path = list(repairer.plan('bfs', start, goal, search))
+        assert_valid_path(grid, start, goal, path)
+        assert bool(path) == bool(bfs(grid, start, goal))
+        if path:
+            start = path[0]
+        goal = rng.choice(grid.get_neighbors(goal) or (goal,)) if rng.random() < 0.9 else \
+            rng.choice(grid.walkable_cells())
+    assert repairer.reused + repairer.repaired > repairer.recomputed
+    assert search.calls < 800
+
+
+def chase(ghost, cell, goal):
+    """Ставит привидение в cell, Пакмана в goal и строит путь, как Ghost.update_path в игре"""
+    ghost.x, ghost.y = (cell[0] + 0.5) * GRID_SIZE, (cell[1] + 0.5) * GRID_SIZE
+    ghost.last_seen_pacman = goal
+    ghost.update_path(SimpleNamespace(x=(goal[0] + 0.5) * GRID_SIZE, y=(goal[1] + 0.5) * GRID_SIZE))
+    return [ghost.next_target] + list(ghost.path)
+
+
+@pytest.mark.parametrize('method', ['greedy', 'dfs'])
+def test_ghost_searches_again_when_goal_moves_onto_its_path(method):
+    # У greedy и dfs кусок старого пути до новой цели - не то, что нашел бы их поиск:
+    # при новой цели привидение должно получить ровно результат полного поиска
+    rng = random.Random(method)
+    grid = Grid(generate_maze(21, 21, 'medium', seed=1))
+    ghost = Ghost(grid.maze, pathfinding_method=method, grid=grid, headless=True)
+    search = PATHFINDERS[method]
+    differs = 0
+    for start, goal in random_pairs(grid, 200, rng):
+        if start == goal:
+            continue
+        path = chase(ghost, start, goal)
+        if len(path) < 4:
+            continue
+        new_goal = path[rng.randrange(2, len(path) - 1)]
+        repaired = chase(ghost, path[0], new_goal)
+        assert repaired == search(grid, path[0], new_goal)
+        differs += repaired != path[1:path.index(new_goal) + 1]
+    assert differs > 0  # Иначе тест не отличил бы обрезку старого пути от поиска
+    assert ghost.repairer.repaired == 0
+
+
+def test_shortest_ghost_cuts_path_when_goal_moves_onto_it():
+    rng = random.Random(5)
+    grid = Grid(generate_maze(21, 21, 'medium', seed=1))
+    ghost = Ghost(grid.maze, pathfinding_method='a_star', grid=grid, headless=True)
+    for start, goal in random_pairs(grid, 50, rng):
+        if start == goal:
+            continue
+        path = chase(ghost, start, goal)
+        if len(path) < 4:
+            continue
+        new_goal = path[rng.randrange(2, len(path) - 1)]
+        assert chase(ghost, path[0], new_goal) == path[1:path.index(new_goal) + 1]
+    assert ghost.repairer.repaired > 0
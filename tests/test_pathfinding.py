@@ -0,0 +1,47 @@
+"""Поиски пути из algorithms.py против bfs: корректность и длина пути"""
+import random
+
+import pytest
+
+from algorithms import PATHFINDERS, SHORTEST_PATHFINDERS
+from grid import Grid
+from maze import generate_maze
+
+from tests.helpers import assert_matches_bfs, grids, random_pairs, toggle_random_cell
+
+SEARCHES = ['a_star', 'bfs', 'greedy', 'dfs', 'jps', 'bidirectional_bfs', 'bidirectional_a_star']
+
+
+@pytest.mark.parametrize('name', SEARCHES)
+def test_pathfinder_matches_bfs(name):
+    search = PATHFINDERS[name]
+    rng = random.Random(name)
+    for grid in grids():
+        for start, goal in random_pairs(grid, 40, rng):
+            assert_matches_bfs(grid, start, goal, search(grid, start, goal), name in SHORTEST_PATHFINDERS)
+
+
+@pytest.mark.parametrize('name', SEARCHES)
+def test_pathfinder_trivial_and_unreachable(name):
+    search = PATHFINDERS[name]
+    # Две комнаты, разделенные стеной; во всех методах путь без стартовой клетки
+    grid = Grid([[1, 1, 1, 1, 1],
+                 [1, 0, 1, 0, 1],
+                 [1, 0, 1, 0, 1],
+                 [1, 1, 1, 1, 1]])
+    assert search(grid, (1, 1), (1, 1)) == []
+    assert search(grid, (1, 1), (3, 2)) == []
+    assert search(grid, (1, 1), (1, 2)) == [(1, 2)]
+
+
+
+@pytest.mark.parametrize('name', SEARCHES)
+def test_pathfinder_after_set_cell(name):
+    # jps держит таблицу прыжков на ревизию Grid: она должна перестраиваться после изменений
+    search = PATHFINDERS[name]
+    rng = random.Random(name)
+    grid = Grid(generate_maze(25, 25, 'easy', seed=7))
+    for _ in range(30):
+        toggle_random_cell(grid, rng)
+        for start, goal in random_pairs(grid, 5, rng):
+            assert_matches_bfs(grid, start, goal, search(grid, start, goal), name in SHORTEST_PATHFINDERS)
@@ -0,0 +1,37 @@
+"""Обратный поиск от общей цели (reverse_bfs, batch_paths, SharedPathPlanner) против bfs"""
+import random
+
+from algorithms import batch_paths, follow_next_steps, reverse_bfs
+from grid import Grid
+from maze import generate_maze
+from planner import SharedPathPlanner
+
+from tests.helpers import assert_matches_bfs, grids, toggle_random_cell
+
+
+def test_reverse_bfs_and_batch_paths_match_bfs():
+    rng = random.Random(1)
+    for grid in grids():
+        goal = rng.choice(grid.walkable_cells())
+        starts = [rng.choice(grid.walkable_cells()) for _ in range(10)]
+        next_step = reverse_bfs(grid, goal)
+        paths = batch_paths(grid, starts, goal)
+        for start in starts:
+            assert_matches_bfs(grid, start, goal, follow_next_steps(next_step, start))
+            assert_matches_bfs(grid, start, goal, paths[start])
+
+
+def test_shared_planner_matches_bfs_and_resets_on_set_cell():
+    rng = random.Random(4)
+    grid = Grid(generate_maze(31, 31, 'medium', seed=4))
+    planner = SharedPathPlanner(grid)
+    goal = rng.choice(grid.walkable_cells())
+    starts = [rng.choice(grid.walkable_cells()) for _ in range(8)]
+    for start, path in planner.plan(starts, goal).items():
+        assert_matches_bfs(grid, start, goal, path)
+    assert planner.searches == 1  # Одно дерево на все старты
+    for _ in range(20):
+        toggle_random_cell(grid, rng)
+        for start in starts:
+            if start in grid.neighbors and goal in grid.neighbors:
+                assert_matches_bfs(grid, start, goal, planner.path(start, goal))
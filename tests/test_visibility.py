@@ -0,0 +1,66 @@
+"""VisibilityMap против исходных проверок Ghost: обхода строки/столбца и линии Брезенхема без кэша"""
+import random
+
+from grid import Grid
+from maze import generate_maze
+from visibility import VisibilityMap
+
+from tests.helpers import toggle_random_cell
+
+
+def walk_can_see(maze, start, goal):
+    """Исходный Ghost.can_see: только по одной строке или столбцу, без стен между клетками"""
+    (x1, y1), (x2, y2) = start, goal
+    if x1 == x2:
+        return all(maze[y][x1] != 1 for y in range(min(y1, y2), max(y1, y2) + 1))
+    if y1 == y2:
+        return all(maze[y1][x] != 1 for x in range(min(x1, x2), max(x1, x2) + 1))
+    return False
+
+
+def bresenham(x1, y1, x2, y2):
+    """Исходный Ghost.bresenham: список точек строится заново при каждом вызове"""
+    points = []
+    dx, dy = abs(x2 - x1), abs(y2 - y1)
+    sx = 1 if x1 < x2 else -1
+    sy = 1 if y1 < y2 else -1
+    err = dx - dy
+    while True:
+        points.append((x1, y1))
+        if x1 == x2 and y1 == y2:
+            break
+        e2 = err * 2
+        if e2 > -dy:
+            err -= dy
+            x1 += sx
+        if e2 < dx:
+            err += dx
+            y1 += sy
+    return points
+
+
+def assert_matches_original(visibility, grid):
+    maze = grid.maze
+    cells = [(x, y) for y in range(grid.height) for x in range(grid.width)]  # Вместе со стенами
+    for start in cells:
+        for goal in cells:
+            assert visibility.can_see(start, goal) == walk_can_see(maze, start, goal), (start, goal)
+            expected = all(maze[y][x] != 1 for x, y in bresenham(*start, *goal))
+            assert visibility.line_of_sight(start, goal) == expected, (start, goal)
+
+
+def test_visibility_matches_original_checks_for_all_pairs():
+    for difficulty, seed in (('easy', 1), ('hard', 2)):
+        grid = Grid(generate_maze(15, 15, difficulty, seed=seed))
+        assert_matches_original(VisibilityMap(grid), grid)
+
+
+def test_visibility_rebuilds_after_set_cell():
+    rng = random.Random(3)
+    grid = Grid(generate_maze(13, 13, 'medium', seed=3))
+    grid.fill_dots()
+    visibility = VisibilityMap(grid)
+    for _ in range(5):
+        toggle_random_cell(grid, rng)
+    visibility.refresh()
+    assert_matches_original(visibility, grid)
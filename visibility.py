@@ -0,0 +1,108 @@
+from array import array
+from functools import lru_cache
+from typing import Tuple
+
+from grid import Grid
+
+
+@lru_cache(maxsize=4096)
+def line_offsets(dx: int, dy: int) -> Tuple[Tuple[int, int], ...]:
+    """Клетки линии Брезенхема из (0, 0) в (dx, dy); линия не зависит от сдвига, поэтому кэшируется"""
+    points = []
+    x, y = 0, 0
+    adx, ady = abs(dx), abs(dy)
+    sx = 1 if dx > 0 else -1
+    sy = 1 if dy > 0 else -1
+    err = adx - ady
+    while True:
+        points.append((x, y))
+        if x == dx and y == dy:
+            break
+        e2 = err * 2
+        if e2 > -ady:
+            err -= ady
+            x += sx
+        if e2 < adx:
+            err += adx
+            y += sy
+    return tuple(points)
+
+
+class VisibilityMap:
+    """Номера отрезков без стен по строкам и столбцам для проверки видимости за O(1).
+
+    Две клетки в одной строке видят друг друга, если лежат в одном горизонтальном
+    отрезке (между ними нет стены); для столбцов так же. Для стен номер равен -1.
+    Карта перестраивается, когда меняется ревизия Grid. line_of_sight проверяет
+    произвольную линию Брезенхема, беря растеризацию линии из кэша.
+    """
+
+    def __init__(self, grid: Grid):
+        self.grid = grid
+        self.revision = None
+        self.row_ids = array('i')
+        self.column_ids = array('i')
+        self.build()
+
+    def build(self):
+        grid = self.grid
+        width, height = grid.width, grid.height
+        passable = grid.neighbors
+        row_ids = array('i', [-1]) * (width * height)
+        column_ids = array('i', [-1]) * (width * height)
+
+        segment = 0
+        for y in range(height):
+            previous = False
+            for x in range(width):
+                if (x, y) in passable:
+                    if not previous:
+                        segment += 1
+                    row_ids[y * width + x] = segment
+                    previous = True
+                else:
+                    previous = False
+        for x in range(width):
+            previous = False
+            for y in range(height):
+                if (x, y) in passable:
+                    if not previous:
+                        segment += 1
+                    column_ids[y * width + x] = segment
+                    previous = True
+                else:
+                    previous = False
+
+        self.row_ids = row_ids
+        self.column_ids = column_ids
+        self.revision = grid.revision
+
+    def refresh(self):
+        """Перестраивает карту, если в Grid менялись стены (дешево: сравнивается ревизия)"""
+        if self.revision != self.grid.revision:
+            self.build()
+
+    def can_see(self, start: Tuple[int, int], goal: Tuple[int, int]) -> bool:
+        """Видимость по прямой строке или столбцу, как в исходном Ghost.can_see"""
+        (x1, y1), (x2, y2) = start, goal
+        grid = self.grid
+        if not (grid.in_bounds(x1, y1) and grid.in_bounds(x2, y2)):
+            return False
+        if y1 == y2:
+            segment = self.row_ids[y1 * grid.width + x1]
+            return segment != -1 and segment == self.row_ids[y2 * grid.width + x2]
+        if x1 == x2:
+            segment = self.column_ids[y1 * grid.width + x1]
+            return segment != -1 and segment == self.column_ids[y2 * grid.width + x2]
+        return False
+
+    def line_of_sight(self, start: Tuple[int, int], goal: Tuple[int, int]) -> bool:
+        """Нет ли стен на линии Брезенхема между клетками"""
+        (x1, y1), (x2, y2) = start, goal
+        if x1 == x2 or y1 == y2:
+            return self.can_see(start, goal)
+        grid = self.grid
+        if not (grid.in_bounds(x1, y1) and grid.in_bounds(x2, y2)):
+            return False
+        passable = grid.neighbors
+        return all((x1 + dx, y1 + dy) in passable for dx, dy in line_offsets(x2 - x1, y2 - y1))